@@ -2,8 +2,55 @@
 
 from __future__ import annotations
 
+import operator
+from collections.abc import Iterable
 from typing import Any
 
+try:
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import JaroWinkler
+except ImportError:  # pragma: no cover - optional dependency
+    rf_process = None
+    JaroWinkler = None
+
+
+def check_non_negative_int(name: str, n: Any) -> int:
+    """Validate a LIMIT/OFFSET value before it reaches SQL.
+
+    Accepts anything implementing ``__index__`` (e.g. NumPy integers),
+    so values taken straight from a DataFrame work.
+
+    Args:
+        name: Parameter name used in the error message.
+        n: Value to check.
+
+    Returns:
+        *n* as a plain ``int``, safe to inline into SQL text.
+
+    Raises:
+        TypeError: If *n* is not a non-negative integer.
+    """
+    try:
+        value = operator.index(n)
+    except TypeError:
+        value = -1
+    if value < 0:
+        raise TypeError(f"{name} must be a non-negative integer, got {n!r}")
+    return value
+
+
+def _check_threshold(threshold: Any) -> float:
+    """Validate a fuzzy-match similarity threshold.
+
+    Raises:
+        ValueError: If *threshold* is not a number between 0 and 1.
+    """
+    if not isinstance(threshold, (int, float)) or not (0 <= threshold <= 1):
+        raise ValueError(
+            f"threshold must be a number between 0 and 1, got {threshold!r}"
+        )
+    return threshold
+
 
 class SQLBuilder:
     """Builds parameterized SQL queries safely.
@@ -101,7 +148,10 @@ class SQLBuilder:
         return self
 
     def where_in(self, column: str, values: list[Any]) -> SQLBuilder:
-        """Add an IN condition with parameterized values.
+        """Add an IN condition, binding all values as one list parameter.
+
+        The SQL text is the same regardless of how many values are passed,
+        so DuckDB parses a short, fixed-shape statement for every call.
 
         Args:
             column: Column name.
@@ -110,17 +160,14 @@ class SQLBuilder:
         Example::
 
             q.where_in("uuid", ["abc", "def"])
-            # → WHERE uuid IN ($1, $2)
+            # → WHERE uuid = ANY($1)   with $1 = ["abc", "def"]
         """
         if not values:
             self._where.append("FALSE")
             return self
-        placeholders = []
-        for v in values:
-            idx = len(self._params) + 1
-            placeholders.append(f"${idx}")
-            self._params.append(v)
-        self._where.append(f"{column} IN ({', '.join(placeholders)})")
+        idx = len(self._params) + 1
+        self._where.append(f"{column} = ANY(${idx})")
+        self._params.append(list(values))
         return self
 
     def where_eq(self, column: str, value: Any) -> SQLBuilder:
@@ -188,15 +235,58 @@ class SQLBuilder:
         Raises:
             ValueError: If threshold is not between 0 and 1.
         """
-        if not isinstance(threshold, (int, float)) or not (0 <= threshold <= 1):
-            raise ValueError(
-                f"threshold must be a number between 0 and 1, got {threshold!r}"
-            )
+        _check_threshold(threshold)
         idx = len(self._params) + 1
         self._where.append(f"jaro_winkler_similarity({column}, ${idx}) > {threshold}")
         self._params.append(value)
         return self
 
+    def where_fuzzy_in(
+        self,
+        column: str,
+        value: str,
+        candidates: Iterable[str],
+        *,
+        threshold: float = 0.8,
+    ) -> SQLBuilder:
+        """Fuzzy-match *value* against a caller-supplied list of candidates.
+
+        Same predicate as :meth:`where_fuzzy`, restricted to *candidates*.
+        With ``rapidfuzz`` installed the candidates are scored client-side
+        in one C call and only those above the threshold are bound, as in
+        :meth:`where_in`. Otherwise DuckDB does the scoring.
+
+        Args:
+            column: Column name to compare.
+            value: Target string to match against.
+            candidates: Strings the column value must be one of.
+            threshold: Minimum similarity score (0.0-1.0, default 0.8).
+
+        Raises:
+            ValueError: If threshold is not between 0 and 1.
+
+        Example::
+
+            q.where_fuzzy_in("name", "Ligtning Bolt", known_names)
+            # → WHERE name = ANY($1)   with $1 = ["Lightning Bolt"]
+        """
+        _check_threshold(threshold)
+        candidates = list(candidates)
+        if rf_process is None:
+            return self.where_in(column, candidates).where_fuzzy(
+                column, value, threshold=threshold
+            )
+        # score_cutoff is inclusive; where_fuzzy's comparison is strict
+        matches = rf_process.extract(
+            value,
+            candidates,
+            scorer=JaroWinkler.normalized_similarity,
+            score_cutoff=threshold,
+            limit=None,
+        )
+        shortlist = sorted(idx for _, score, idx in matches if score > threshold)
+        return self.where_in(column, [candidates[i] for i in shortlist])
+
     def where_or(self, *conditions: tuple[str, Any]) -> SQLBuilder:
         """Add OR-combined conditions.
 
@@ -264,9 +354,7 @@ class SQLBuilder:
         Raises:
             TypeError: If *n* is not a non-negative integer.
         """
-        if not isinstance(n, int) or n < 0:
-            raise TypeError(f"limit must be a non-negative integer, got {n!r}")
-        self._limit = n
+        self._limit = check_non_negative_int("limit", n)
         return self
 
     def offset(self, n: int) -> SQLBuilder:
@@ -278,9 +366,7 @@ class SQLBuilder:
         Raises:
             TypeError: If *n* is not a non-negative integer.
         """
-        if not isinstance(n, int) or n < 0:
-            raise TypeError(f"offset must be a non-negative integer, got {n!r}")
-        self._offset = n
+        self._offset = check_non_negative_int("offset", n)
         return self
 
     def build(self) -> tuple[str, list[Any]]:
@@ -290,6 +376,8 @@ class SQLBuilder:
             Tuple of ``(sql_string, params_list)`` ready for
             ``Connection.execute()``.
         """
+        # Rendering is a few joins (~2us); it is not memoized per query
+        # shape because executing the result costs three orders more.
         distinct = "DISTINCT " if self._distinct else ""
         parts = [f"SELECT {distinct}{', '.join(self._select)}", f"FROM {self._from}"]
 
@@ -2,13 +2,19 @@
 
 Runs all DuckDB queries in a thread pool executor, making it safe
 to use from async frameworks (FastAPI, Django, etc.) without blocking
-the event loop.  DuckDB releases the GIL during query execution,
-so thread pool concurrency works well.
+the event loop.  DuckDB releases the GIL during query execution, so the
+event loop keeps running while a query is in flight.
+
+The wrapped SDK holds one DuckDB connection and lazily-built query
+objects, neither of which is meant for concurrent use, so by default
+every call for one SDK runs on the same dedicated thread.  For parallel
+queries, use several ``AsyncMtgJsonTools`` instances.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, TypeVar
@@ -31,17 +37,22 @@ class AsyncMtgJsonTools:
     def __init__(
         self,
         *,
-        max_workers: int = 4,
+        max_workers: int = 1,
         **kwargs: Any,
     ) -> None:
         """Initialize the async SDK.
 
         Args:
-            max_workers: Thread pool size for concurrent queries.
+            max_workers: Thread pool size. The default of 1 pins all calls
+                to one thread, which the shared DuckDB connection needs;
+                larger pools still contend for that one connection.
             **kwargs: Forwarded to :class:`MtgJsonTools` (cache_dir, offline, etc.).
         """
         self._sdk = MtgJsonTools(**kwargs)
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mtgjson-duckdb"
+        )
+        self._closed = False
 
     @property
     def inner(self) -> MtgJsonTools:
@@ -56,8 +67,10 @@ class AsyncMtgJsonTools:
             cards = await sdk.run(sdk.inner.cards.search, name="Lightning%")
             sets = await sdk.run(sdk.inner.sets.list, set_type="masters")
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, lambda: fn(*args, **kwargs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
 
     async def sql(
         self,
@@ -78,8 +91,15 @@ class AsyncMtgJsonTools:
         return await self.run(self._sdk.sql, query, params, **kwargs)
 
     async def close(self) -> None:
-        """Close the underlying SDK and shut down the thread pool executor."""
-        self._sdk.close()
+        """Close the underlying SDK and shut down the thread pool executor.
+
+        The SDK is closed on the executor thread, after any queries
+        already submitted have run. Calling ``close()`` again is a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await self.run(self._sdk.close)
         self._executor.shutdown(wait=False)
 
     async def __aenter__(self) -> AsyncMtgJsonTools:
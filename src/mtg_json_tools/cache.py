@@ -5,15 +5,25 @@ from __future__ import annotations
 import gzip
 import json
 import logging
+import mmap
+import time
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from .config import CDN_BASE, JSON_FILES, META_URL, PARQUET_FILES, default_cache_dir
 
 logger = logging.getLogger("mtg_json_tools")
 
+# Minimum seconds between on_progress calls during a download
+_PROGRESS_INTERVAL = 0.1
+
 
 class CacheManager:
     """Downloads and caches MTGJSON data files from the CDN.
@@ -114,8 +124,9 @@ class CacheManager:
 
         Downloads to a temp file first and renames on success, so an
         interrupted download never leaves a corrupt partial file behind.
-        Calls ``on_progress(filename, bytes_downloaded, total_bytes)``
-        after each chunk if a progress callback was provided.
+        Calls ``on_progress(filename, bytes_downloaded, total_bytes)`` if a
+        progress callback was provided, at most once per
+        ``_PROGRESS_INTERVAL`` seconds plus once when the download completes.
         """
         url = f"{CDN_BASE}/{filename}"
         logger.info("Downloading %s", url)
@@ -126,12 +137,21 @@ class CacheManager:
                 resp.raise_for_status()
                 total = int(resp.headers.get("content-length", 0)) or None
                 downloaded = 0
+                on_progress = self._on_progress
+                # Coalesce callbacks so a slow handler (e.g. a progress bar
+                # redraw) is not invoked for every 64 KiB chunk
+                last_report = time.monotonic()
                 with open(tmp_dest, "wb") as f:
                     for chunk in resp.iter_bytes(chunk_size=65536):
                         f.write(chunk)
                         downloaded += len(chunk)
-                        if self._on_progress:
-                            self._on_progress(filename, downloaded, total)
+                        if on_progress:
+                            now = time.monotonic()
+                            if now - last_report >= _PROGRESS_INTERVAL:
+                                last_report = now
+                                on_progress(filename, downloaded, total)
+                if on_progress:
+                    on_progress(filename, downloaded, total)
             tmp_dest.replace(dest)
         except BaseException:
             # Clean up partial temp file on any error (including KeyboardInterrupt)
@@ -216,11 +236,12 @@ class CacheManager:
                 with gzip.open(path, "rt", encoding="utf-8") as f:
                     return json.load(f)
             else:
-                return json.loads(path.read_text(encoding="utf-8"))
+                return _load_plain_json(path)
         except (
             gzip.BadGzipFile,
             EOFError,
             json.JSONDecodeError,
+            ValueError,
             OSError,
             UnicodeDecodeError,
         ) as e:
@@ -238,3 +259,24 @@ class CacheManager:
         if self.cache_dir.exists():
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+def _load_plain_json(path: Path) -> Any:
+    """Parse an uncompressed JSON file.
+
+    With orjson installed the file is memory-mapped and parsed straight from
+    the page cache, skipping the ``str`` copy and UTF-8 decode that
+    ``read_text`` + ``json.loads`` would make.
+
+    Raises:
+        ValueError: If the file is empty or not valid JSON.
+    """
+    with open(path, "rb") as f:
+        if orjson is None:
+            return json.load(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            view = memoryview(buf)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
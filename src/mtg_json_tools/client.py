@@ -291,6 +291,11 @@ class MtgJsonTools:
 
         # Clear view registry — next access re-registers from fresh parquet
         self._conn._registered_views.clear()
+        self._conn._derived_tables.clear()
+
+        # Drop in-process caches held by query objects callers may still reference
+        if self._tokens is not None:
+            self._tokens.refresh()
 
         # Reset lazy query objects so they re-run _ensure() on next access
         self._cards = None
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections import OrderedDict
 from typing import Any
 
 import duckdb
@@ -11,6 +13,10 @@ from .cache import CacheManager
 
 logger = logging.getLogger("mtg_json_tools")
 
+# Parsed statements Connection.prepare keeps before evicting the least
+# recently used one.
+_STATEMENT_CACHE_SIZE = 256
+
 # Known list columns that don't follow the plural naming convention
 # (e.g. colorIdentity, availability, producedMana). Always converted
 # to arrays regardless of heuristic detection.
@@ -124,11 +130,22 @@ class Connection:
         self.cache = cache
         self._conn: duckdb.DuckDBPyConnection = duckdb.connect(":memory:")
         self._registered_views: set[str] = set()
+        # Helper tables built from a registered table, mapped to that
+        # source table. Dropped when the source is replaced; not exported.
+        self._derived_tables: dict[str, str] = {}
+        self._statements: OrderedDict[str, duckdb.Statement] = OrderedDict()
+        self._closed = False
 
     def close(self) -> None:
-        """Close the underlying DuckDB connection and free resources."""
-        if self._conn:
-            self._conn.close()
+        """Close the underlying DuckDB connection and free resources.
+
+        Safe to call more than once; later calls are no-ops.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._statements.clear()
+        self._conn.close()
 
     def _ensure_view(self, view_name: str) -> None:
         """Lazily register a parquet file as a DuckDB view.
@@ -271,7 +288,7 @@ class Connection:
         """
         if not data:
             return
-        self._conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+        self._drop_table(table_name)
         import json as _json
         import os
         import tempfile
@@ -290,6 +307,29 @@ class Connection:
             os.unlink(f.name)
         self._registered_views.add(table_name)
 
+    def register_many(self, tables: dict[str, list[dict[str, Any]]]) -> None:
+        """Create several tables from lists of dicts in one transaction.
+
+        Each entry is loaded as by :meth:`register_table_from_data`. The
+        catalog changes commit together, and if any table fails to load
+        none of them are kept.
+
+        Args:
+            tables: Mapping of table name to its list of row dicts.
+        """
+        before = set(self._registered_views)
+        derived = dict(self._derived_tables)
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            for table_name, data in tables.items():
+                self.register_table_from_data(table_name, data)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            self._registered_views.intersection_update(before)
+            self._derived_tables = derived
+            raise
+        self._conn.execute("COMMIT")
+
     def register_table_from_ndjson(self, table_name: str, ndjson_path: str) -> None:
         """Create a DuckDB table from a newline-delimited JSON file.
 
@@ -300,7 +340,7 @@ class Connection:
             table_name: Name for the new DuckDB table.
             ndjson_path: Path to the NDJSON file.
         """
-        self._conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+        self._drop_table(table_name)
         path_fwd = ndjson_path.replace("\\", "/")
         self._conn.execute(
             f"CREATE TABLE {table_name} AS "
@@ -308,6 +348,48 @@ class Connection:
         )
         self._registered_views.add(table_name)
 
+    def register_table_from_arrow(self, table_name: str, data: Any) -> None:
+        """Create a DuckDB table from Arrow data.
+
+        DuckDB scans Arrow memory directly, so there is no text
+        serialization or type inference on the way in.
+
+        Args:
+            table_name: Name for the new DuckDB table.
+            data: A ``pyarrow.Table`` or ``pyarrow.RecordBatchReader``.
+        """
+        staging = f"_{table_name}_arrow"
+        self._drop_table(table_name)
+        self._conn.register(staging, data)
+        try:
+            self._conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM {staging}")
+        finally:
+            self._conn.unregister(staging)
+        self._registered_views.add(table_name)
+
+    def register_derived_table(self, table_name: str, source: str, sql: str) -> None:
+        """Create a helper table from the result of *sql* over *source*.
+
+        The table is dropped whenever *source* is replaced or dropped
+        through this connection, and is left out of :meth:`views` and
+        ``export_db``.
+
+        Args:
+            table_name: Name for the new DuckDB table.
+            source: Registered table the query reads from.
+            sql: SELECT producing the table's rows.
+        """
+        self._conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS {sql}")
+        self._derived_tables[table_name] = source
+
+    def _drop_table(self, table_name: str) -> None:
+        """Drop *table_name* and every helper table derived from it."""
+        for name, source in list(self._derived_tables.items()):
+            if source == table_name:
+                self._conn.execute(f"DROP TABLE IF EXISTS {name}")
+                del self._derived_tables[name]
+        self._conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+
     def ensure_views(self, *view_names: str) -> None:
         """Ensure one or more views are registered, downloading data if needed.
 
@@ -317,39 +399,95 @@ class Connection:
         for name in view_names:
             self._ensure_view(name)
 
+    def prepare(self, sql: str) -> duckdb.Statement:
+        """Parse a fixed-shape SQL statement once and return it for reuse.
+
+        The returned statement can be passed to :meth:`execute`,
+        :meth:`execute_rows`, :meth:`execute_scalar` or :meth:`execute_df`
+        in place of a SQL string, skipping the parser on every call.
+        Intended for the SDK's own fixed query shapes — statements are
+        cached per SQL string, keeping the ``_STATEMENT_CACHE_SIZE`` most
+        recently used.
+
+        Args:
+            sql: A single SQL statement with ``$N`` placeholders.
+
+        Returns:
+            The parsed ``duckdb.Statement``.
+        """
+        stmt = self._statements.get(sql)
+        if stmt is None:
+            stmt = self._conn.extract_statements(sql)[0]
+            self._statements[sql] = stmt
+            if len(self._statements) > _STATEMENT_CACHE_SIZE:
+                self._statements.popitem(last=False)
+        else:
+            self._statements.move_to_end(sql)
+        return stmt
+
     def execute(
         self,
-        sql: str,
+        sql: str | duckdb.Statement,
         params: list[Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Execute SQL and return results as list of dicts.
 
         Automatically converts date/datetime objects to ISO format strings
         for compatibility with Pydantic models that expect string dates.
-        Handles nested structs and lists recursively.
+        Handles nested structs and lists recursively. Built on
+        :meth:`execute_rows`, so only columns with a temporal DuckDB type
+        are walked.
 
         Args:
-            sql: SQL query string.
+            sql: SQL query string, or a statement from :meth:`prepare`.
             params: Optional positional query parameters.
 
         Returns:
             List of row dicts.
         """
+        columns, rows = self.execute_rows(sql, params)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def execute_rows(
+        self,
+        sql: str | duckdb.Statement,
+        params: list[Any] | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Execute SQL and return column names plus row tuples.
+
+        Lower-level form of :meth:`execute`: column names are returned
+        once and rows stay as tuples, so hot paths that don't need dicts
+        can skip building them. Date/time values are converted to ISO
+        strings, but only in columns whose type may hold them (see
+        ``_may_hold_dates``).
+
+        Args:
+            sql: SQL query string, or a statement from :meth:`prepare`.
+            params: Optional positional query parameters.
+
+        Returns:
+            Tuple of ``(column_names, rows)``.
+        """
         if params:
             result = self._conn.execute(sql, params)
         else:
             result = self._conn.execute(sql)
         if result.description is None:
-            return []
+            return [], []
         columns = [desc[0] for desc in result.description]
+        temporal = {
+            i for i, desc in enumerate(result.description) if _may_hold_dates(desc[1])
+        }
         rows = result.fetchall()
-        out: list[dict[str, Any]] = []
-        for row in rows:
-            d: dict[str, Any] = {}
-            for col, val in zip(columns, row):
-                d[col] = _coerce_dates(val)
-            out.append(d)
-        return out
+        if temporal:
+            rows = [
+                tuple(
+                    _coerce_dates(val) if i in temporal else val
+                    for i, val in enumerate(row)
+                )
+                for row in rows
+            ]
+        return columns, rows
 
     def execute_json(
         self,
@@ -359,9 +497,10 @@ class Connection:
         """Execute SQL and return results as a JSON string.
 
         Uses DuckDB's native ``to_json(list(...))`` serialization which
-        bypasses Python dict construction entirely.  Combine with Pydantic
-        V2's ``TypeAdapter.validate_json()`` for 2-5x faster model parsing
-        compared to the dict-based ``execute()`` path.
+        bypasses Python dict construction entirely; DATE and TIMESTAMP
+        values come out as ISO strings without any Python-side coercion.
+        Suited to handing results straight to an HTTP response or to
+        Pydantic V2's ``TypeAdapter.validate_json()``.
 
         Args:
             sql: SQL query string.
@@ -384,34 +523,47 @@ class Connection:
 
     def execute_models(
         self,
-        sql: str,
+        sql: str | duckdb.Statement,
         params: list[Any] | None = None,
         *,
         adapter: Any = None,
+        model: type | None = None,
     ) -> list[Any]:
         """Execute SQL and parse results directly into Pydantic models.
 
-        Combines ``execute_json()`` with Pydantic V2's
-        ``TypeAdapter.validate_json()`` for 2-5x faster model construction
-        on large result sets — bypasses Python dict construction entirely.
+        Rows are fetched as dicts and handed to the adapter's
+        ``validate_python()`` in a single call, so the whole list is
+        validated in one Rust-side pass rather than model by model. This
+        benchmarks at parity with round-tripping through ``execute_json()``
+        on wide result sets and about 2x faster on small ones.
 
         Args:
-            sql: SQL query string.
+            sql: SQL query string or a statement from ``prepare()``.
             params: Optional query parameters.
             adapter: A ``pydantic.TypeAdapter`` instance for the target
                 list type (e.g. ``TypeAdapter(list[CardSet])``).
+            model: Alternatively, the model class itself. Its
+                ``TypeAdapter(list[model])`` is built once and reused.
 
         Returns:
             List of validated Pydantic model instances.
-        """
-        json_str = self.execute_json(sql, params)
-        return adapter.validate_json(json_str)
 
-    def execute_scalar(self, sql: str, params: list[Any] | None = None) -> Any:
+        Raises:
+            TypeError: If neither ``adapter`` nor ``model`` is given.
+        """
+        if adapter is None:
+            if model is None:
+                raise TypeError("execute_models() requires adapter= or model=")
+            adapter = _list_adapter(model)
+        return adapter.validate_python(self.execute(sql, params))
+
+    def execute_scalar(
+        self, sql: str | duckdb.Statement, params: list[Any] | None = None
+    ) -> Any:
         """Execute SQL and return a single scalar value.
 
         Args:
-            sql: SQL query that returns one row, one column.
+            sql: SQL query (or prepared statement) returning one row, one column.
             params: Optional query parameters.
 
         Returns:
@@ -424,11 +576,13 @@ class Connection:
         row = result.fetchone()
         return row[0] if row else None
 
-    def execute_df(self, sql: str, params: list[Any] | None = None) -> Any:
+    def execute_df(
+        self, sql: str | duckdb.Statement, params: list[Any] | None = None
+    ) -> Any:
         """Execute SQL and return a Polars DataFrame.
 
         Args:
-            sql: SQL query string.
+            sql: SQL query string, or a statement from :meth:`prepare`.
             params: Optional query parameters.
 
         Returns:
@@ -460,6 +614,26 @@ class Connection:
         return self._conn
 
 
+@functools.cache
+def _list_adapter(model: type) -> Any:
+    """Return a cached ``TypeAdapter(list[model])``; building one compiles a schema."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(list[model])
+
+
+def _may_hold_dates(type_code: Any) -> bool:
+    """Whether a ``cursor.description`` type may contain date/time values.
+
+    DuckDB 1.4+ reports SQL type names, nested element types included
+    (``DATE``, ``STRUCT(d DATE)``, ``VARCHAR[]``). Earlier releases report
+    Python-ish names (``Date``, ``DATETIME``) and only ``list`` / ``dict``
+    for nested types, so those are always treated as possibly temporal.
+    """
+    name = str(type_code).upper()
+    return "DATE" in name or "TIME" in name or name in ("LIST", "DICT")
+
+
 def _coerce_dates(val: Any) -> Any:
     """Recursively convert date/datetime objects to ISO strings."""
     import datetime
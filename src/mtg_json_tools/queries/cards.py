@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 from pydantic import TypeAdapter
@@ -13,6 +14,12 @@ from ..models.cards import CardAtomic, CardSet
 _CARD_SET_LIST = TypeAdapter(list[CardSet])
 _CARD_ATOMIC_LIST = TypeAdapter(list[CardAtomic])
 
+# UUIDs are bound as one JSON array string: DuckDB converts a Python list
+# parameter element by element (~0.1ms each), a JSON string in one step.
+_GET_BY_UUIDS_SQL = (
+    "SELECT * FROM cards WHERE uuid = ANY(from_json($1, '[\"VARCHAR\"]'))"
+)
+
 
 class CardQuery:
     """Query interface for MTG card data.
@@ -89,13 +96,13 @@ class CardQuery:
                 else self._conn.execute_df("SELECT * FROM cards WHERE FALSE")
             )
         self._ensure()
-        q = SQLBuilder("cards").where_in("uuid", uuids)
-        sql, params = q.build()
+        stmt = self._conn.prepare(_GET_BY_UUIDS_SQL)
+        params = [json.dumps(list(uuids))]
         if as_dataframe:
-            return self._conn.execute_df(sql, params)
+            return self._conn.execute_df(stmt, params)
         if as_dict:
-            return self._conn.execute(sql, params)
-        return self._conn.execute_models(sql, params, adapter=_CARD_SET_LIST)
+            return self._conn.execute(stmt, params)
+        return self._conn.execute_models(stmt, params, adapter=_CARD_SET_LIST)
 
     def get_by_name(
         self,
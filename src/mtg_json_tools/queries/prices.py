@@ -2,18 +2,65 @@
 
 from __future__ import annotations
 
+import gzip
+import io
+import itertools
 import json
 import logging
 import os
 import tempfile
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
+from .._sql import check_non_negative_int
 from ..cache import CacheManager
 from ..connection import Connection
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
 logger = logging.getLogger("mtg_json_tools")
 
+# Price categories emitted per provider, in output order.
+_CATEGORIES = ("buylist", "retail")
+
+# Column order of flattened price rows.
+_PRICE_COLUMNS = (
+    "uuid",
+    "source",
+    "provider",
+    "currency",
+    "category",
+    "finish",
+    "date",
+    "price",
+)
+
+# Rows per Arrow RecordBatch when loading prices via pyarrow.
+_ARROW_BATCH_ROWS = 65536
+
+# Compact separators for NDJSON rows.
+_JSON_SEPARATORS = (",", ":")
+
+# Encoded NDJSON is collected in a bytearray and written out in blocks of
+# about this many bytes instead of two write() calls per row.
+_NDJSON_FLUSH_BYTES = 1 << 20
+
+
+def _dumps_row(row: dict[str, Any]) -> bytes:
+    """Stdlib stand-in for ``orjson.dumps``: compact UTF-8 JSON bytes."""
+    return json.dumps(row, separators=_JSON_SEPARATORS).encode()
+
 
 class PriceQuery:
     """Query interface for card price data.
@@ -36,8 +83,8 @@ class PriceQuery:
     def _ensure(self) -> None:
         """Load price data into DuckDB if not already done.
 
-        Uses streaming NDJSON to avoid holding the full flattened
-        row list in Python memory (~3-4x reduction in peak memory).
+        Rows are streamed into DuckDB in batches to avoid holding the full
+        flattened row list in Python memory (~3-4x reduction in peak memory).
         """
         if self._loaded:
             return
@@ -55,6 +102,20 @@ class PriceQuery:
         _load_prices_to_duckdb(path, self._conn)
         self._loaded = True
 
+    def load_streaming(self, data: dict[str, Any]) -> None:
+        """Load already-parsed price data instead of the cached CDN file.
+
+        Rows are flattened straight into DuckDB (as Arrow batches when
+        pyarrow is installed) without writing the document to disk first.
+        Replaces any price data loaded earlier.
+
+        Args:
+            data: The ``data`` object of an AllPrices-style document,
+                ``{uuid: {source: {provider: {currency, buylist, retail}}}}``.
+        """
+        _load_price_items(data.items(), self._conn)
+        self._loaded = True
+
     def get(self, uuid: str) -> dict | None:
         """Get full price data for a card UUID.
 
@@ -69,8 +130,10 @@ class PriceQuery:
         if "prices_today" not in self._conn._registered_views:
             return None
         rows = self._conn.execute(
-            "SELECT * FROM prices_today WHERE uuid = $1 "
-            "ORDER BY source, provider, category, finish, date",
+            self._conn.prepare(
+                "SELECT * FROM prices_today WHERE uuid = $1 "
+                "ORDER BY source, provider, category, finish, date"
+            ),
             [uuid],
         )
         if not rows:
@@ -114,12 +177,16 @@ class PriceQuery:
         self._ensure()
         if "prices_today" not in self._conn._registered_views:
             return [] if not as_dataframe else None
-        # Subquery to get the max date per grouping, then filter
-        parts = [
-            "SELECT * FROM prices_today",
-            "WHERE uuid = $1",
-            "AND date = (SELECT MAX(p2.date) FROM prices_today p2 WHERE p2.uuid = $1)",
-        ]
+        if "prices_today_latest" in self._conn._derived_tables:
+            parts = ["SELECT * FROM prices_today_latest", "WHERE uuid = $1"]
+        else:
+            # prices_today registered by hand: find the max date per call
+            parts = [
+                "SELECT * FROM prices_today",
+                "WHERE uuid = $1",
+                "AND date = "
+                "(SELECT MAX(p2.date) FROM prices_today p2 WHERE p2.uuid = $1)",
+            ]
         params: list[Any] = [uuid]
         idx = 2
 
@@ -138,13 +205,13 @@ class PriceQuery:
             params.append(category)
             idx += 1
 
-        sql = " ".join(parts)
+        # Filters only add placeholders, so each combination is one cached
+        # statement shape.
+        stmt = self._conn.prepare(" ".join(parts))
         if as_dataframe:
-            return self._conn.execute_df(sql, params)
-        rows = self._conn.execute(sql, params)
-        if as_dict:
-            return rows
-        return rows
+            return self._conn.execute_df(stmt, params)
+        cols, rows = self._conn.execute_rows(stmt, params)
+        return [dict(zip(cols, row)) for row in rows]
 
     def history(
         self,
@@ -207,13 +274,13 @@ class PriceQuery:
 
         parts.append("ORDER BY date ASC")
 
-        sql = " ".join(parts)
+        # Filters only add placeholders, so each combination is one cached
+        # statement shape.
+        stmt = self._conn.prepare(" ".join(parts))
         if as_dataframe:
-            return self._conn.execute_df(sql, params)
-        rows = self._conn.execute(sql, params)
-        if as_dict:
-            return rows
-        return rows
+            return self._conn.execute_df(stmt, params)
+        cols, rows = self._conn.execute_rows(stmt, params)
+        return [dict(zip(cols, row)) for row in rows]
 
     def price_trend(
         self,
@@ -263,8 +330,7 @@ class PriceQuery:
             params.append(finish)
             idx += 1
 
-        sql = " ".join(parts)
-        rows = self._conn.execute(sql, params)
+        rows = self._conn.execute(self._conn.prepare(" ".join(parts)), params)
         if not rows or rows[0].get("data_points", 0) == 0:
             return None
         return rows[0]
@@ -303,7 +369,9 @@ class PriceQuery:
             "ORDER BY p.price ASC "
             "LIMIT 1"
         )
-        rows = self._conn.execute(sql, [name, provider, finish, category])
+        rows = self._conn.execute(
+            self._conn.prepare(sql), [name, provider, finish, category]
+        )
         return rows[0] if rows else None
 
     def cheapest_printings(
@@ -348,9 +416,18 @@ class PriceQuery:
             "AND p.date = (SELECT MAX(date) FROM prices_today) "
             "GROUP BY c.name "
             "ORDER BY min_price ASC "
-            f"LIMIT {limit} OFFSET {offset}"
+            "LIMIT $4 OFFSET $5"
+        )
+        return self._conn.execute(
+            self._conn.prepare(sql),
+            [
+                provider,
+                finish,
+                category,
+                check_non_negative_int("limit", limit),
+                check_non_negative_int("offset", offset),
+            ],
         )
-        return self._conn.execute(sql, [provider, finish, category])
 
     def most_expensive_printings(
         self,
@@ -393,40 +470,67 @@ class PriceQuery:
             "AND p.date = (SELECT MAX(date) FROM prices_today) "
             "GROUP BY c.name "
             "ORDER BY max_price DESC "
-            f"LIMIT {limit} OFFSET {offset}"
+            "LIMIT $4 OFFSET $5"
+        )
+        return self._conn.execute(
+            self._conn.prepare(sql),
+            [
+                provider,
+                finish,
+                category,
+                check_non_negative_int("limit", limit),
+                check_non_negative_int("offset", offset),
+            ],
         )
-        return self._conn.execute(sql, [provider, finish, category])
 
 
 def _load_prices_to_duckdb(path: Path, conn: Connection) -> None:
-    """Parse AllPricesToday JSON, stream-flatten to NDJSON, load into DuckDB.
-
-    Memory optimization: instead of accumulating millions of flat dicts in a
-    Python list (which doubles peak memory), we stream each row directly to
-    an NDJSON temp file. DuckDB then reads the file in a single pass.
+    """Parse AllPricesToday JSON, flatten, and load into DuckDB.
 
-    Peak memory: ~1x (parsed JSON dict) instead of ~3-4x (dict + list + temp file).
+    With ijson installed the source document is parsed incrementally, so
+    peak memory is one card's price entry rather than the whole file.
+    See ``_load_price_items`` for how rows reach DuckDB.
     """
-    import gzip
+    # Unlike SKUs, prices are not handed to DuckDB's read_json: the file is
+    # one JSON object, which DuckDB parses on a single thread, and unnesting
+    # the five MAP levels costs about twice as long as the Arrow path below.
+    _load_price_items(_iter_price_entries(path), conn)
 
-    # Parse JSON — required for deeply nested structure, can't avoid this
-    if path.suffix == ".gz":
-        with gzip.open(path, "rt", encoding="utf-8") as f:
-            raw = json.load(f)
-    else:
-        raw = json.loads(path.read_text(encoding="utf-8"))
 
-    data = raw.get("data", {})
-    del raw  # Free wrapper dict immediately
+def _load_price_items(items: Iterable[tuple[str, Any]], conn: Connection) -> None:
+    """Flatten ``(uuid, formats)`` pairs into the ``prices_today`` table.
+
+    With pyarrow installed, flattened rows are batched into Arrow
+    RecordBatches that DuckDB ingests directly — no JSON re-encode and
+    no second JSON parse inside DuckDB. Otherwise rows are streamed to an
+    NDJSON temp file instead of being accumulated in a Python list.
+
+    If *items* yields no price rows, any previously loaded price tables
+    are dropped.
+    """
+    if pa is not None:
+        batches = _iter_price_batches(items)
+        first = next(batches, None)
+        if first is None:
+            _drop_prices(conn)
+            return
+        reader = pa.RecordBatchReader.from_batches(
+            first.schema, itertools.chain([first], batches)
+        )
+        conn.register_table_from_arrow("prices_today", reader)
+        _register_latest_prices(conn)
+        return
 
     tmp_fd, tmp_path = tempfile.mkstemp(suffix=".ndjson")
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8", buffering=1024 * 1024) as ndjson:
-            count = _stream_flatten_prices(data, ndjson)
-        del data  # Free source dict before DuckDB ingestion
+        with os.fdopen(tmp_fd, "wb", buffering=1024 * 1024) as ndjson:
+            count = _stream_flatten_price_items(items, ndjson)
 
         if count > 0:
             conn.register_table_from_ndjson("prices_today", tmp_path)
+            _register_latest_prices(conn)
+        else:
+            _drop_prices(conn)
     finally:
         try:
             os.unlink(tmp_path)
@@ -434,22 +538,57 @@ def _load_prices_to_duckdb(path: Path, conn: Connection) -> None:
             pass
 
 
-def _stream_flatten_prices(data: dict[str, Any], out: Any) -> int:
-    """Stream-flatten nested price data to an NDJSON file handle.
+def _register_latest_prices(conn: Connection) -> None:
+    """Materialize each card's most recent price rows as ``prices_today_latest``.
 
-    Writes one JSON line per price point, avoiding a large intermediate list.
-    Returns the number of rows written.
+    ``PriceQuery.today`` then filters this small table by uuid instead of
+    finding the max date for the card in ``prices_today`` on every call.
+    """
+    conn.register_derived_table(
+        "prices_today_latest",
+        "prices_today",
+        "SELECT * FROM prices_today QUALIFY date = MAX(date) OVER (PARTITION BY uuid)",
+    )
 
-    Input structure::
 
-        {uuid: {paper: {provider: {currency, buylist, retail}}, mtgo: {...}}}
+def _drop_prices(conn: Connection) -> None:
+    """Drop ``prices_today`` and the tables derived from it."""
+    conn._drop_table("prices_today")
+    conn._registered_views.discard("prices_today")
 
-    Output per line::
 
-        {uuid, source, provider, currency, category, finish, date, price}
+def _iter_price_entries(path: Path) -> Iterator[tuple[str, Any]]:
+    """Yield ``(uuid, formats)`` pairs from the ``data`` object of a price file.
+
+    Streams entries with ijson when it is installed; otherwise falls back
+    to parsing the whole document with ``json.load``. Both gzip and plain
+    files are read through a 1 MB buffer so the parser is fed large reads.
     """
-    count = 0
-    for uuid, formats in data.items():
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    if path.suffix == ".gz":
+        f = io.BufferedReader(gzip.open(path, "rb"), buffer_size=1 << 20)
+    else:
+        f = open(path, "rb", buffering=1 << 20)
+    with f:
+        if ijson is not None:
+            yield from ijson.kvitems(f, "data", use_float=True)
+        else:
+            yield from json.load(f).get("data", {}).items()
+
+
+def _iter_price_groups(
+    items: Iterable[tuple[str, Any]],
+) -> Iterator[tuple[tuple, dict]]:
+    """Flatten ``(uuid, formats)`` pairs down to their date/price series.
+
+    Yields ``(key, date_prices)`` where *key* holds the first six
+    ``_PRICE_COLUMNS`` values shared by every point in the series.
+    """
+    for uuid, formats in items:
         if not isinstance(formats, dict):
             continue
         for source, providers in formats.items():  # paper, mtgo
@@ -461,34 +600,174 @@ def _stream_flatten_prices(data: dict[str, Any], out: Any) -> int:
             ) in providers.items():  # tcgplayer, cardkingdom, etc.
                 if not isinstance(price_data, dict):
                     continue
-                currency = price_data.get("currency", "USD")
-                for category_name in ("buylist", "retail"):
-                    category_data = price_data.get(category_name)
+                price_get = price_data.get
+                currency = price_get("currency", "USD")
+                for category_name in _CATEGORIES:
+                    category_data = price_get(category_name)
                     if not isinstance(category_data, dict):
                         continue
                     for (
                         finish,
                         date_prices,
                     ) in category_data.items():  # normal, foil, etched
-                        if not isinstance(date_prices, dict):
-                            continue
-                        for date, price in date_prices.items():
-                            if price is not None:
-                                out.write(
-                                    json.dumps(
-                                        {
-                                            "uuid": uuid,
-                                            "source": source,
-                                            "provider": provider,
-                                            "currency": currency,
-                                            "category": category_name,
-                                            "finish": finish,
-                                            "date": date,
-                                            "price": float(price),
-                                        },
-                                        separators=(",", ":"),
-                                    )
-                                )
-                                out.write("\n")
-                                count += 1
+                        if isinstance(date_prices, dict):
+                            yield (
+                                (
+                                    uuid,
+                                    source,
+                                    provider,
+                                    currency,
+                                    category_name,
+                                    finish,
+                                ),
+                                date_prices,
+                            )
+
+
+def _iter_price_rows(items: Iterable[tuple[str, Any]]) -> Iterator[tuple]:
+    """Flatten ``(uuid, formats)`` pairs into one tuple per price point.
+
+    Tuples follow ``_PRICE_COLUMNS`` order.
+    """
+    for key, date_prices in _iter_price_groups(items):
+        for date, price in date_prices.items():
+            if price is not None:
+                yield key + (date, float(price))
+
+
+def _price_schema() -> Any:
+    """Arrow schema of the ``prices_today`` table. Requires pyarrow."""
+    return pa.schema(
+        [(name, pa.string()) for name in _PRICE_COLUMNS[:6]]
+        + [("date", pa.date32()), ("price", pa.float64())]
+    )
+
+
+def _flatten_prices_arrow(data: dict[str, Any]) -> Any:
+    """Flatten nested price data into a ``pyarrow.Table``.
+
+    In-memory counterpart of ``_stream_flatten_prices`` with the same rows,
+    built by ``_iter_price_batches``. Requires pyarrow.
+    """
+    return pa.Table.from_batches(
+        list(_iter_price_batches(data.items())), schema=_price_schema()
+    )
+
+
+def _iter_price_batches(
+    items: Iterable[tuple[str, Any]], batch_size: int = _ARROW_BATCH_ROWS
+) -> Iterator[Any]:
+    """Flatten price entries into Arrow RecordBatches of about *batch_size* rows.
+
+    Columns are filled a whole date series at a time. Dates and prices are
+    extended straight from the series dict; the six key columns get one
+    value per series plus a run end, and are expanded by Arrow's
+    ``run_end_decode`` in C. No per-row Python object is built.
+    Requires pyarrow.
+    """
+    schema = _price_schema()
+    keys: list[list] = [[] for _ in range(6)]
+    run_ends: list[int] = []
+    dates: list[str] = []
+    prices: list[float] = []
+    size = 0
+    for key, date_prices in _iter_price_groups(items):
+        if None in date_prices.values():
+            date_prices = {d: p for d, p in date_prices.items() if p is not None}
+        n = len(date_prices)
+        if not n:
+            continue
+        for column, value in zip(keys, key):
+            column.append(value)
+        size += n
+        run_ends.append(size)
+        dates.extend(date_prices.keys())
+        prices.extend(date_prices.values())
+        if size >= batch_size:
+            yield _columns_to_batch(keys, run_ends, dates, prices, schema)
+            keys = [[] for _ in range(6)]
+            run_ends, dates, prices = [], [], []
+            size = 0
+    if size:
+        yield _columns_to_batch(keys, run_ends, dates, prices, schema)
+
+
+def _columns_to_batch(
+    keys: list[list],
+    run_ends: list[int],
+    dates: list[str],
+    prices: list[float],
+    schema: Any,
+) -> Any:
+    ends = pa.array(run_ends, type=pa.int32())
+    arrays = [
+        pc.run_end_decode(
+            pa.RunEndEncodedArray.from_arrays(ends, pa.array(values, pa.string()))
+        )
+        for values in keys
+    ]
+    # Dates are built as strings, then cast to date32 per batch.
+    arrays.append(pa.array(dates, pa.string()).cast(pa.date32()))
+    try:
+        arrays.append(pa.array(prices, pa.float64()))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Non-numeric prices (e.g. "1.5"): coerce like the NDJSON path does.
+        arrays.append(pa.array([float(p) for p in prices], pa.float64()))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _stream_flatten_prices(data: dict[str, Any], out: Any) -> int:
+    """Stream-flatten nested price data to a binary NDJSON file handle.
+
+    Writes one JSON line per price point, avoiding a large intermediate list.
+    *out* must accept ``bytes`` (e.g. a file opened ``"wb"`` or
+    ``io.BytesIO``). Returns the number of rows written.
+
+    Input structure::
+
+        {uuid: {paper: {provider: {currency, buylist, retail}}, mtgo: {...}}}
+
+    Output per line::
+
+        {uuid, source, provider, currency, category, finish, date, price}
+    """
+    return _stream_flatten_price_items(data.items(), out)
+
+
+def _iter_flatten_prices(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield one row dict per price point, keyed by ``_PRICE_COLUMNS``.
+
+    In-memory counterpart of ``_stream_flatten_prices`` with the same rows.
+    """
+    for row in _iter_price_rows(data.items()):
+        yield dict(zip(_PRICE_COLUMNS, row))
+
+
+def _stream_flatten_price_items(items: Iterable[tuple[str, Any]], out: Any) -> int:
+    """Flatten ``(uuid, formats)`` pairs to NDJSON; see ``_stream_flatten_prices``."""
+    count = 0
+    # Bind hot-loop callables to locals to skip attribute lookups per row
+    dumps = orjson.dumps if orjson is not None else _dumps_row
+    flush = out.write
+    buf = bytearray()
+    # One record dict is reused for every row. The six key fields are set
+    # once per date series; only date and price change per price point.
+    record: dict[str, Any] = dict.fromkeys(_PRICE_COLUMNS)
+    fill = record.update
+    key_columns = _PRICE_COLUMNS[:6]
+    for key, date_prices in _iter_price_groups(items):
+        fill(zip(key_columns, key))
+        for date, price in date_prices.items():
+            if price is None:
+                continue
+            record["date"] = date
+            record["price"] = float(price)
+            buf += dumps(record)
+            buf += b"\n"
+            count += 1
+        if len(buf) >= _NDJSON_FLUSH_BYTES:
+            flush(buf)
+            buf.clear()
+    if buf:
+        flush(buf)
     return count
@@ -187,18 +187,22 @@ class SetQuery:
         if "prices_today" not in self._conn._registered_views:
             return None
 
+        # Materialize the set's UUIDs first so the hash join is built from
+        # one set's cards instead of the whole cards table.
         sql = """
+            WITH s AS (
+                SELECT uuid FROM cards WHERE setCode = $1
+            )
             SELECT
-                COUNT(DISTINCT c.uuid) AS card_count,
+                COUNT(DISTINCT s.uuid) AS card_count,
                 ROUND(SUM(p.price), 2) AS total_value,
                 ROUND(AVG(p.price), 2) AS avg_value,
                 MIN(p.price) AS min_value,
                 MAX(p.price) AS max_value,
                 MAX(p.date) AS date
-            FROM cards c
-            JOIN prices_today p ON c.uuid = p.uuid
-            WHERE c.setCode = $1
-              AND p.provider = $2
+            FROM s
+            JOIN prices_today p USING (uuid)
+            WHERE p.provider = $2
               AND p.currency = $3
               AND p.finish = $4
               AND p.category = $5
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-import os
-import tempfile
+import struct
+import uuid
 from pathlib import Path
+from typing import Any, cast
+
+import duckdb
 
 from ..cache import CacheManager
 from ..connection import Connection
@@ -14,6 +18,29 @@ from ..models.submodels import TcgplayerSkus
 
 logger = logging.getLogger("mtg_json_tools")
 
+# Column types of the known SKU keys (mirrors models.submodels.TcgplayerSkus).
+# Other keys keep the type DuckDB infers from the data.
+_SKU_COLUMNS = {
+    "condition": "VARCHAR",
+    "finish": "VARCHAR",
+    "language": "VARCHAR",
+    "printing": "VARCHAR",
+    "productId": "BIGINT",
+    "skuId": "BIGINT",
+}
+
+# The SKU file is a single top-level JSON object, so DuckDB's per-object
+# size cap must cover the whole document. It is sized from the file:
+# DuckDB <1.3 allocates a buffer of this size up front.
+_MIN_JSON_OBJECT_SIZE = 16 * 1024 * 1024  # DuckDB's default
+_MAX_JSON_OBJECT_SIZE = 2**32 - 1  # maximum_object_size is a UINTEGER
+
+# Catalog alias the persisted SKU database is attached under.
+_SKU_CATALOG = "sku_cache"
+
+# Columns SkuQuery filters on with equality predicates.
+_SKU_INDEX_COLUMNS = ("uuid", "skuId", "productId")
+
 
 class SkuQuery:
     """Query interface for TCGPlayer SKU data.
@@ -36,8 +63,8 @@ class SkuQuery:
     def _ensure(self) -> None:
         """Load SKU data into DuckDB if not already done.
 
-        Uses streaming NDJSON to avoid holding the full flattened
-        row list in Python memory.
+        The JSON is flattened by DuckDB itself, so no Python-side row
+        list or NDJSON staging file is ever built.
         """
         if self._loaded:
             return
@@ -76,7 +103,8 @@ class SkuQuery:
         )
         if as_dict:
             return rows
-        return [TcgplayerSkus(**r) for r in rows]  # type: ignore[misc]
+        # TypedDict construction is just a dict copy; the rows already match.
+        return cast("list[TcgplayerSkus]", rows)
 
     def find_by_sku_id(self, sku_id: int) -> dict | None:
         """Find a SKU by its TCGPlayer SKU ID.
@@ -115,42 +143,141 @@ class SkuQuery:
 
 
 def _load_skus_to_duckdb(path: Path, conn: Connection) -> None:
-    """Parse TcgplayerSkus JSON, stream-flatten to NDJSON, load into DuckDB.
+    """Load TcgplayerSkus JSON into DuckDB, flattening in SQL.
+
+    DuckDB's JSON reader decompresses ``.gz`` natively and flattens the
+    ``{uuid: [sku, ...]}`` map itself, so the document is never
+    materialized as Python objects. See ``_create_sku_table``.
 
-    Same memory optimization as prices: streams rows to NDJSON temp file
-    instead of accumulating in a Python list.
+    The flattened table is persisted to ``skus_<key>.duckdb`` in the cache
+    directory, keyed by the source file's mtime and size. Later processes
+    attach that file read-only and skip ingestion entirely.
     """
-    import gzip
+    stat = path.stat()
+    key = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()
+    db_path = conn.cache.cache_dir / f"skus_{key[:16]}.duckdb"
+    if not db_path.exists():
+        _build_sku_database(path, db_path)
+        _remove_stale_sku_databases(db_path)
+
+    db_str = str(db_path).replace("\\", "/")
+    conn._conn.execute(f"DETACH DATABASE IF EXISTS {_SKU_CATALOG}")
+    try:
+        conn._conn.execute(f"ATTACH '{db_str}' AS {_SKU_CATALOG} (READ_ONLY)")
+    except duckdb.BinderException as exc:
+        if "Unique file handle conflict" not in str(exc):
+            raise
+        # Some DuckDB releases (1.4.0) refuse to attach a file another
+        # in-process connection already holds; flatten into this one.
+        logger.debug("SKU cache %s in use, loading into memory", db_path)
+        _create_sku_table(conn._conn, path)
+        if conn.execute_scalar("SELECT COUNT(*) FROM tcgplayer_skus") == 0:
+            conn._conn.execute("DROP TABLE tcgplayer_skus")
+            return
+        conn._registered_views.add("tcgplayer_skus")
+        return
+    count = conn._conn.execute(
+        f"SELECT COUNT(*) FROM {_SKU_CATALOG}.tcgplayer_skus"
+    ).fetchone()[0]
+    if count == 0:
+        conn._conn.execute(f"DETACH {_SKU_CATALOG}")
+        return
+    conn._conn.execute(
+        "CREATE OR REPLACE VIEW tcgplayer_skus AS "
+        f"SELECT * FROM {_SKU_CATALOG}.tcgplayer_skus"
+    )
+    conn._registered_views.add("tcgplayer_skus")
 
-    if path.suffix == ".gz":
-        with gzip.open(path, "rt", encoding="utf-8") as f:
-            raw = json.load(f)
-    else:
-        raw = json.loads(path.read_text(encoding="utf-8"))
 
-    data = raw.get("data", {})
-    del raw
+def _build_sku_database(path: Path, db_path: Path) -> None:
+    """Flatten *path* into a standalone DuckDB file at *db_path*.
 
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".ndjson")
+    Builds into a temp file and renames on success, so an interrupted
+    build never leaves a half-written cache behind.
+    """
+    # Unique per build, so processes warming the same cache directory
+    # never write to each other's temp file.
+    tmp_path = db_path.with_name(f"{db_path.stem}.{uuid.uuid4().hex}.tmp")
     try:
-        count = 0
-        with os.fdopen(tmp_fd, "w", encoding="utf-8", buffering=1024 * 1024) as ndjson:
-            for uuid, skus in data.items():
-                if not isinstance(skus, list):
-                    continue
-                for sku in skus:
-                    if isinstance(sku, dict):
-                        row = dict(sku)
-                        row["uuid"] = uuid
-                        ndjson.write(json.dumps(row, separators=(",", ":")))
-                        ndjson.write("\n")
-                        count += 1
-        del data
-
-        if count > 0:
-            conn.register_table_from_ndjson("tcgplayer_skus", tmp_path)
+        with duckdb.connect(str(tmp_path)) as db:
+            _create_sku_table(db, path)
+            # SKU data is rebuilt, never mutated, so ART indexes can't go
+            # stale. They turn SkuQuery's equality lookups into index scans.
+            for column in _SKU_INDEX_COLUMNS:
+                db.execute(
+                    f"CREATE INDEX idx_skus_{column} ON tcgplayer_skus({column})"
+                )
+        tmp_path.replace(db_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _create_sku_table(db: duckdb.DuckDBPyConnection, path: Path) -> None:
+    """Create ``tcgplayer_skus`` in *db* from the SKU document at *path*.
+
+    Entries whose value is not a list, and list items that are not
+    objects, are skipped. Every key found on an SKU becomes a column:
+    known keys use ``_SKU_COLUMNS`` types, others the type DuckDB infers.
+    """
+    path_str = str(path).replace("\\", "/")
+    db.execute(
+        "CREATE OR REPLACE TEMP TABLE _sku_json AS "
+        "SELECT uuid, sku FROM ("
+        "  SELECT e.key AS uuid, unnest(from_json(e.value, '[\"JSON\"]')) AS sku "
+        "  FROM ("
+        "    SELECT unnest(map_entries(data)) AS e "
+        f"    FROM read_json('{path_str}', "
+        "      columns = {data: 'MAP(VARCHAR, JSON)'}, "
+        f"      maximum_object_size = {_json_object_size_limit(path)})"
+        "  ) WHERE json_type(e.value) = 'ARRAY'"
+        ") WHERE json_type(sku) = 'OBJECT'"
+    )
+    try:
+        keys = {
+            key
+            for (key,) in db.execute(
+                "SELECT DISTINCT unnest(json_keys(sku)) FROM _sku_json"
+            ).fetchall()
+        }
+        columns: dict[str, Any] = {}
+        if keys - _SKU_COLUMNS.keys() - {"uuid"}:
+            # Only pay for full type inference when unknown keys exist.
+            (inferred,) = db.execute(
+                "SELECT json_group_structure(sku) FROM _sku_json"
+            ).fetchone()
+            columns = json.loads(inferred)
+            columns.pop("uuid", None)
+        columns.update(_SKU_COLUMNS)
+        structure = json.dumps(columns).replace("'", "''")
+        db.execute(
+            "CREATE OR REPLACE TABLE tcgplayer_skus AS "
+            f"SELECT unnest(json_transform(sku, '{structure}')), uuid FROM _sku_json"
+        )
     finally:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+        db.execute("DROP TABLE IF EXISTS _sku_json")
+
+
+def _json_object_size_limit(path: Path) -> int:
+    """Return a ``maximum_object_size`` large enough for the document at *path*.
+
+    Uses twice the uncompressed size, read from the gzip trailer for
+    ``.gz`` files, clamped between DuckDB's default and its maximum.
+    """
+    size = path.stat().st_size
+    if path.suffix == ".gz":
+        with open(path, "rb") as f:
+            f.seek(-4, 2)
+            # ISIZE: uncompressed length of the (single) member, mod 2**32
+            size = max(size, struct.unpack("<I", f.read(4))[0])
+    return min(max(2 * size, _MIN_JSON_OBJECT_SIZE), _MAX_JSON_OBJECT_SIZE)
+
+
+def _remove_stale_sku_databases(current: Path) -> None:
+    """Delete persisted SKU databases built from older source files."""
+    for old in current.parent.glob("skus_*.duckdb"):
+        if old != current:
+            try:
+                old.unlink()
+            except OSError:
+                logger.debug("Could not remove stale SKU cache %s", old)
@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from typing import Any
 
 from pydantic import TypeAdapter
 
-from .._sql import SQLBuilder
+from .._sql import SQLBuilder, check_non_negative_int
 from ..connection import Connection
 from ..models.cards import CardToken
 
 _CARD_TOKEN_LIST = TypeAdapter(list[CardToken])
 
+# Fixed-shape search for the common exact name + set lookup. Parsed once
+# per connection via Connection.prepare() and dispatched to by search().
+_SEARCH_BY_NAME_SET_SQL = (
+    "SELECT * FROM tokens WHERE name = $1 AND setCode = $2 "
+    "ORDER BY name ASC, number ASC LIMIT $3 OFFSET $4"
+)
+_SEARCH_ALL_SQL = (
+    "SELECT * FROM tokens ORDER BY name ASC, number ASC LIMIT $1 OFFSET $2"
+)
+_FOR_SET_SQL = (
+    "SELECT * FROM tokens WHERE setCode = $1 ORDER BY name ASC, number ASC LIMIT 1000"
+)
+# UUIDs are bound as one JSON array string: DuckDB converts a Python list
+# parameter element by element (~0.1ms each), a JSON string in one step.
+_GET_BY_UUIDS_SQL = (
+    "SELECT * FROM tokens WHERE uuid = ANY(from_json($1, '[\"VARCHAR\"]'))"
+)
+
 
 class TokenQuery:
     """Query interface for MTG token card data.
@@ -25,9 +45,30 @@ class TokenQuery:
 
     def __init__(self, conn: Connection) -> None:
         self._conn = conn
+        self._loaded = False
+        self._total_count: int | None = None
+        # Per-instance LRU of token rows for repeated UUID lookups. Rows,
+        # not models, are cached so each caller gets its own mutable model.
+        self._get_token_cached = lru_cache(maxsize=4096)(self._fetch_token)
 
     def _ensure(self) -> None:
-        self._conn.ensure_views("tokens")
+        # One attribute check on the hot path instead of a registry lookup
+        if not self._loaded:
+            self._conn.ensure_views("tokens")
+            self._loaded = True
+
+    def _fetch_token(self, uuid: str) -> dict[str, Any] | None:
+        rows = self._conn.execute("SELECT * FROM tokens WHERE uuid = $1", [uuid])
+        return rows[0] if rows else None
+
+    def refresh(self) -> None:
+        """Drop cached lookups so the next call re-reads the tokens view.
+
+        Called by :meth:`MtgJsonTools.refresh` when new data is detected.
+        """
+        self._loaded = False
+        self._total_count = None
+        self._get_token_cached.cache_clear()
 
     def get_by_uuid(
         self,
@@ -45,17 +86,18 @@ class TokenQuery:
 
         Returns:
             A CardToken model, dict, or DataFrame — or None if not found.
+            Rows are cached per UUID until :meth:`refresh` is called; each
+            call still returns a new model.
         """
         self._ensure()
         sql = "SELECT * FROM tokens WHERE uuid = $1"
         if as_dataframe:
             return self._conn.execute_df(sql, [uuid])
+        if not as_dict:
+            row = self._get_token_cached(uuid)
+            return CardToken.model_validate(row) if row is not None else None
         rows = self._conn.execute(sql, [uuid])
-        if not rows:
-            return None
-        if as_dict:
-            return rows[0]
-        return CardToken.model_validate(rows[0])
+        return rows[0] if rows else None
 
     def get_by_uuids(
         self,
@@ -81,13 +123,13 @@ class TokenQuery:
                 else self._conn.execute_df("SELECT * FROM tokens WHERE FALSE")
             )
         self._ensure()
-        q = SQLBuilder("tokens").where_in("uuid", uuids)
-        sql, params = q.build()
+        stmt = self._conn.prepare(_GET_BY_UUIDS_SQL)
+        params = [json.dumps(list(uuids))]
         if as_dataframe:
-            return self._conn.execute_df(sql, params)
+            return self._conn.execute_df(stmt, params)
         if as_dict:
-            return self._conn.execute(sql, params)
-        return self._conn.execute_models(sql, params, adapter=_CARD_TOKEN_LIST)
+            return self._conn.execute(stmt, params)
+        return self._conn.execute_models(stmt, params, adapter=_CARD_TOKEN_LIST)
 
     def get_by_name(
         self,
@@ -152,6 +194,35 @@ class TokenQuery:
             List of matching CardToken models, dicts, or a DataFrame.
         """
         self._ensure()
+        if not (name or set_code or colors or types or artist):
+            stmt = self._conn.prepare(_SEARCH_ALL_SQL)
+            params = [
+                check_non_negative_int("limit", limit),
+                check_non_negative_int("offset", offset),
+            ]
+            if as_dataframe:
+                return self._conn.execute_df(stmt, params)
+            if as_dict:
+                return self._conn.execute(stmt, params)
+            return self._conn.execute_models(stmt, params, adapter=_CARD_TOKEN_LIST)
+
+        if (
+            name
+            and set_code
+            and "%" not in name
+            and not (colors or types or artist or as_dataframe)
+        ):
+            stmt = self._conn.prepare(_SEARCH_BY_NAME_SET_SQL)
+            params = [
+                name,
+                set_code,
+                check_non_negative_int("limit", limit),
+                check_non_negative_int("offset", offset),
+            ]
+            if as_dict:
+                return self._conn.execute(stmt, params)
+            return self._conn.execute_models(stmt, params, adapter=_CARD_TOKEN_LIST)
+
         q = SQLBuilder("tokens")
 
         if name:
@@ -170,6 +241,9 @@ class TokenQuery:
             q.where_like("artist", f"%{artist}%")
 
         if colors:
+            # One scalar list_contains per color, as in CardQuery.search. A
+            # single list_has_all against a bound list scans slower (4.9ms
+            # vs 3.4ms over 20k tokens), so keep the per-color form.
             for color in colors:
                 idx = len(q._params) + 1
                 q._where.append(f"list_contains(colors, ${idx})")
@@ -202,9 +276,13 @@ class TokenQuery:
         Returns:
             List of tokens belonging to the specified set.
         """
-        return self.search(
-            set_code=set_code, limit=1000, as_dict=as_dict, as_dataframe=as_dataframe
-        )
+        self._ensure()
+        stmt = self._conn.prepare(_FOR_SET_SQL)
+        if as_dataframe:
+            return self._conn.execute_df(stmt, [set_code])
+        if as_dict:
+            return self._conn.execute(stmt, [set_code])
+        return self._conn.execute_models(stmt, [set_code], adapter=_CARD_TOKEN_LIST)
 
     def count(self, **filters: Any) -> int:
         """Count tokens matching optional column filters.
@@ -217,7 +295,12 @@ class TokenQuery:
         """
         self._ensure()
         if not filters:
-            return self._conn.execute_scalar("SELECT COUNT(*) FROM tokens") or 0
+            # Unfiltered total only changes on data reload; see refresh()
+            if self._total_count is None:
+                self._total_count = (
+                    self._conn.execute_scalar("SELECT COUNT(*) FROM tokens") or 0
+                )
+            return self._total_count
         q = SQLBuilder("tokens").select("COUNT(*)")
         for col, val in filters.items():
             q.where_eq(col, val)
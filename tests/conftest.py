@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import shutil
+
 import pytest
 
 from mtg_json_tools import MtgJsonTools
@@ -558,19 +560,55 @@ def tmp_cache(tmp_path):
     return tmp_path / "cache"
 
 
-@pytest.fixture
-def sample_db(tmp_path):
-    """Create a DuckDB with sample data (no network calls needed)."""
-    cache = CacheManager(tmp_path / "cache", offline=True)
-    conn = Connection(cache)
+# Tables every shared fixture starts with.
+SAMPLE_TABLES = {
+    "cards": SAMPLE_CARDS,
+    "sets": SAMPLE_SETS,
+    "tokens": SAMPLE_TOKENS,
+    "card_identifiers": SAMPLE_IDENTIFIERS,
+    "card_legalities": SAMPLE_LEGALITIES,
+    "card_foreign_data": SAMPLE_FOREIGN_DATA,
+}
+
+
+def _load_sample_tables(conn: Connection) -> None:
+    conn.register_many(SAMPLE_TABLES)
 
-    # Register sample data directly as tables
-    conn.register_table_from_data("cards", SAMPLE_CARDS)
-    conn.register_table_from_data("sets", SAMPLE_SETS)
-    conn.register_table_from_data("tokens", SAMPLE_TOKENS)
-    conn.register_table_from_data("card_identifiers", SAMPLE_IDENTIFIERS)
-    conn.register_table_from_data("card_legalities", SAMPLE_LEGALITIES)
-    conn.register_table_from_data("card_foreign_data", SAMPLE_FOREIGN_DATA)
+
+def _reset_connection(conn: Connection) -> None:
+    """Undo what a test added to a shared connection.
+
+    Drops tables and views outside ``SAMPLE_TABLES``, detaches attached
+    databases, restores the view registry and empties the cache directory.
+    """
+    duck = conn._conn
+    for (db,) in duck.execute(
+        "SELECT database_name FROM duckdb_databases() "
+        "WHERE NOT internal AND database_name != current_database()"
+    ).fetchall():
+        duck.execute(f'DETACH DATABASE "{db}"')
+    for name, kind in duck.execute(
+        "SELECT table_name, table_type FROM information_schema.tables "
+        "WHERE table_catalog = current_database() AND table_schema = 'main'"
+    ).fetchall():
+        if name not in SAMPLE_TABLES:
+            kind = "VIEW" if kind == "VIEW" else "TABLE"
+            duck.execute(f'DROP {kind} IF EXISTS "{name}"')
+    conn._registered_views.clear()
+    conn._registered_views.update(SAMPLE_TABLES)
+    conn._derived_tables.clear()
+    for path in conn.cache.cache_dir.iterdir():
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+
+@pytest.fixture(scope="session")
+def _session_db(tmp_path_factory):
+    cache = CacheManager(tmp_path_factory.mktemp("cache"), offline=True)
+    conn = Connection(cache)
+    _load_sample_tables(conn)
 
     yield conn
 
@@ -579,18 +617,39 @@ def sample_db(tmp_path):
 
 
 @pytest.fixture
-def sdk_offline(tmp_path):
-    """SDK instance with sample data loaded (no network)."""
-    sdk = MtgJsonTools(cache_dir=tmp_path / "cache", offline=True)
-
-    # Load sample data directly
-    sdk._conn.register_table_from_data("cards", SAMPLE_CARDS)
-    sdk._conn.register_table_from_data("sets", SAMPLE_SETS)
-    sdk._conn.register_table_from_data("tokens", SAMPLE_TOKENS)
-    sdk._conn.register_table_from_data("card_identifiers", SAMPLE_IDENTIFIERS)
-    sdk._conn.register_table_from_data("card_legalities", SAMPLE_LEGALITIES)
-    sdk._conn.register_table_from_data("card_foreign_data", SAMPLE_FOREIGN_DATA)
+def sample_db(_session_db):
+    """DuckDB with sample data (no network calls needed).
+
+    One connection is shared by the whole test session; whatever a test
+    adds is removed again afterwards. Tests must not modify the sample
+    tables themselves.
+    """
+    yield _session_db
+
+    _reset_connection(_session_db)
+
+
+@pytest.fixture(scope="session")
+def _session_sdk(tmp_path_factory):
+    sdk = MtgJsonTools(cache_dir=tmp_path_factory.mktemp("cache"), offline=True)
+    _load_sample_tables(sdk._conn)
 
     yield sdk
 
     sdk.close()
+
+
+@pytest.fixture
+def sdk_offline(_session_sdk):
+    """SDK instance with sample data loaded (no network).
+
+    One SDK is shared by the whole test session; after each test its lazy
+    query objects are dropped and the connection is reset. Tests must not
+    modify the sample tables themselves.
+    """
+    yield _session_sdk
+
+    for attr, value in vars(_session_sdk).items():
+        if attr not in ("_cache", "_conn") and value is not None:
+            setattr(_session_sdk, attr, None)
+    _reset_connection(_session_sdk._conn)
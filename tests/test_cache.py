@@ -91,3 +91,27 @@ def test_load_json_truncated_removed(tmp_path):
 
     assert not truncated_path.exists()
     cache.close()
+
+
+def test_load_json_empty_removed(tmp_path):
+    """Empty JSON file is deleted and FileNotFoundError raised."""
+    cache = CacheManager(tmp_path / "cache", offline=True)
+    empty_path = cache.cache_dir / "Meta.json"
+    empty_path.write_bytes(b"")
+
+    with pytest.raises(FileNotFoundError, match="corrupt"):
+        cache.load_json("meta")
+
+    assert not empty_path.exists()
+    cache.close()
+
+
+def test_load_json_plain(tmp_path):
+    """Uncompressed JSON file is parsed."""
+    cache = CacheManager(tmp_path / "cache", offline=True)
+    (cache.cache_dir / "Meta.json").write_text(
+        '{"data": {"version": "5.2.2"}}', encoding="utf-8"
+    )
+
+    assert cache.load_json("meta") == {"data": {"version": "5.2.2"}}
+    cache.close()
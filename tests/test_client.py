@@ -1,9 +1,21 @@
 """Tests for the MtgJsonTools client."""
 
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+
 import duckdb
+import httpx
 import pytest
+from pydantic import TypeAdapter
 
 from mtg_json_tools import AsyncMtgJsonTools, MtgJsonTools
+from mtg_json_tools.cache import CacheManager
+from mtg_json_tools.models.cards import CardSet
+
+# Built once: TypeAdapter construction compiles a validator.
+_CARD_SET_LIST = TypeAdapter(list[CardSet])
 
 
 def test_sdk_repr(sdk_offline):
@@ -88,8 +100,6 @@ def test_refresh_clears_state(tmp_path):
 
 def test_execute_json_basic(sdk_offline):
     """execute_json returns a valid JSON string."""
-    import json
-
     result = sdk_offline._conn.execute_json("SELECT name FROM cards ORDER BY name")
     assert isinstance(result, str)
     parsed = json.loads(result)
@@ -107,8 +117,6 @@ def test_execute_json_empty(sdk_offline):
 
 def test_execute_json_with_params(sdk_offline):
     """execute_json works with parameterized queries."""
-    import json
-
     result = sdk_offline._conn.execute_json(
         "SELECT name FROM cards WHERE uuid = $1", ["card-uuid-001"]
     )
@@ -119,8 +127,6 @@ def test_execute_json_with_params(sdk_offline):
 
 def test_execute_json_dates(sdk_offline):
     """execute_json auto-converts dates to ISO strings."""
-    import json
-
     result = sdk_offline._conn.execute_json(
         "SELECT releaseDate FROM cards WHERE uuid = $1", ["card-uuid-001"]
     )
@@ -130,8 +136,6 @@ def test_execute_json_dates(sdk_offline):
 
 def test_execute_json_arrays(sdk_offline):
     """execute_json preserves arrays as JSON arrays."""
-    import json
-
     result = sdk_offline._conn.execute_json(
         "SELECT colors FROM cards WHERE uuid = $1", ["card-uuid-001"]
     )
@@ -139,9 +143,125 @@ def test_execute_json_arrays(sdk_offline):
     assert parsed[0]["colors"] == ["R"]
 
 
+# === register_table_from_data tests ===
+
+
+def test_register_table_from_data_types_ignore_row_count(tmp_path):
+    """Column types are the same whatever the number of rows."""
+    sdk = MtgJsonTools(cache_dir=tmp_path / "cache", offline=True)
+    row = {
+        "ts": "2024-01-02 03:04:05",
+        "t": "03:04:05",
+        "s": {"d": "2024-01-02"},
+        "dl": ["2024-01-02"],
+    }
+    for name, n in (("few", 63), ("many", 64)):
+        sdk._conn.register_table_from_data(name, [row] * n)
+    describe = "SELECT column_name, column_type FROM (DESCRIBE {})"
+    assert sdk.sql(describe.format("few")) == sdk.sql(describe.format("many"))
+    sdk.close()
+
+
+# === prepare tests ===
+
+
+def test_prepare_evicts_least_recently_used(sdk_offline, monkeypatch):
+    """prepare() keeps a bounded LRU of parsed statements."""
+    monkeypatch.setattr("mtg_json_tools.connection._STATEMENT_CACHE_SIZE", 2)
+    conn = sdk_offline._conn
+    conn._statements.clear()
+    first = conn.prepare("SELECT 1")
+    conn.prepare("SELECT 2")
+    assert conn.prepare("SELECT 1") is first
+    conn.prepare("SELECT 3")
+    assert list(conn._statements) == ["SELECT 1", "SELECT 3"]
+    assert conn.execute(first) == [{"1": 1}]
+
+
+# === register_many tests ===
+
+
+def test_register_many_is_atomic(tmp_path):
+    """register_many keeps no tables when one of them fails to load."""
+    sdk = MtgJsonTools(cache_dir=tmp_path / "cache", offline=True)
+    with pytest.raises(duckdb.Error):
+        sdk._conn.register_many({"ok": [{"a": 1}], "bad name": [{"a": 1}]})
+    assert "ok" not in sdk._conn._registered_views
+    assert sdk.sql(
+        "SELECT COUNT(*) AS n FROM information_schema.tables WHERE table_name = 'ok'"
+    ) == [{"n": 0}]
+    sdk.close()
+
+
+# === close tests ===
+
+
+def test_close_is_idempotent(tmp_path):
+    """Closing the SDK twice is harmless."""
+    sdk = MtgJsonTools(cache_dir=tmp_path / "cache", offline=True)
+    sdk.close()
+    sdk.close()
+    assert sdk._conn._closed
+
+
+# === execute_rows tests ===
+
+
+def test_execute_rows_returns_columns_and_tuples(sdk_offline):
+    """execute_rows returns column names once plus tuple rows."""
+    cols, rows = sdk_offline._conn.execute_rows(
+        "SELECT name, releaseDate FROM cards WHERE uuid = $1", ["card-uuid-001"]
+    )
+    assert cols == ["name", "releaseDate"]
+    assert rows == [("Lightning Bolt", "2018-03-16")]
+
+
+def test_execute_coerces_nested_and_timestamp_dates(sdk_offline):
+    """Dates become ISO strings in scalar, list and struct columns alike."""
+    rows = sdk_offline.sql(
+        "SELECT DATE '2024-01-02' AS d, TIMESTAMP '2024-01-02 03:04:05' AS ts, "
+        "[DATE '2024-01-02'] AS dl, {'d': DATE '2024-01-02'} AS s, "
+        "['x'] AS vl, 1 AS n"
+    )
+    assert rows == [
+        {
+            "d": "2024-01-02",
+            "ts": "2024-01-02T03:04:05",
+            "dl": ["2024-01-02"],
+            "s": {"d": "2024-01-02"},
+            "vl": ["x"],
+            "n": 1,
+        }
+    ]
+
+
 # === export_db tests ===
 
 
+@contextmanager
+def _attached(sdk, path):
+    """Attach an exported file read-only to the SDK's own DuckDB connection.
+
+    Verifies the file without starting a second database instance.
+    """
+    duck = sdk._conn._conn
+    duck.execute(f"ATTACH '{path}' AS verify_db (READ_ONLY)")
+    try:
+        yield duck
+    finally:
+        duck.execute("DETACH verify_db")
+
+
+def _exported_tables(duck):
+    return {
+        row[0]
+        for row in duck.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_catalog = 'verify_db' AND table_schema = 'main'"
+        ).fetchall()
+    }
+
+
 def test_export_db(sdk_offline, tmp_path):
     """export_db creates a queryable DuckDB file."""
     out = tmp_path / "export.duckdb"
@@ -150,14 +270,11 @@ def test_export_db(sdk_offline, tmp_path):
     assert out.exists()
 
     # Verify we can query the exported file independently
-    conn = duckdb.connect(str(out))
-    try:
-        row = conn.execute("SELECT COUNT(*) FROM cards").fetchone()
+    with _attached(sdk_offline, out) as duck:
+        row = duck.execute("SELECT COUNT(*) FROM verify_db.main.cards").fetchone()
         assert row[0] == 3
-        row = conn.execute("SELECT COUNT(*) FROM sets").fetchone()
+        row = duck.execute("SELECT COUNT(*) FROM verify_db.main.sets").fetchone()
         assert row[0] == 2
-    finally:
-        conn.close()
 
 
 def test_export_db_contains_all_views(sdk_offline, tmp_path):
@@ -165,20 +282,34 @@ def test_export_db_contains_all_views(sdk_offline, tmp_path):
     out = tmp_path / "export_all.duckdb"
     sdk_offline.export_db(out)
 
-    conn = duckdb.connect(str(out))
-    try:
-        tables = {
-            row[0]
-            for row in conn.execute(
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main'"
-            ).fetchall()
+    with _attached(sdk_offline, out) as duck:
+        tables = _exported_tables(duck)
+    # All views registered in conftest
+    for expected in ["cards", "sets", "tokens", "card_identifiers"]:
+        assert expected in tables
+
+
+def test_export_db_skips_derived_tables(sdk_offline, tmp_path):
+    """Helper tables such as prices_today_latest are not exported."""
+    sdk_offline.prices.load_streaming(
+        {
+            "card-uuid-001": {
+                "paper": {
+                    "tcgplayer": {
+                        "currency": "USD",
+                        "retail": {"normal": {"2024-01-01": 1.5}},
+                    }
+                }
+            }
         }
-        # All views registered in conftest
-        for expected in ["cards", "sets", "tokens", "card_identifiers"]:
-            assert expected in tables
-    finally:
-        conn.close()
+    )
+    out = tmp_path / "export_prices.duckdb"
+    sdk_offline.export_db(out)
+
+    with _attached(sdk_offline, out) as duck:
+        tables = _exported_tables(duck)
+    assert "prices_today" in tables
+    assert "prices_today_latest" not in tables
 
 
 # === AsyncMtgJsonTools tests ===
@@ -206,6 +337,26 @@ async def test_async_sdk_run(tmp_path):
         assert len(cards) == 3
 
 
+@pytest.mark.asyncio
+async def test_async_sdk_runs_on_one_thread(tmp_path):
+    """Concurrent calls on one SDK all run on its dedicated thread."""
+    async with AsyncMtgJsonTools(cache_dir=tmp_path / "cache", offline=True) as sdk:
+        names = await asyncio.gather(
+            *(sdk.run(lambda: threading.current_thread().name) for _ in range(8))
+        )
+    assert len(set(names)) == 1
+    assert names[0].startswith("mtgjson-duckdb")
+
+
+@pytest.mark.asyncio
+async def test_async_close_is_idempotent(tmp_path):
+    """close() may be called repeatedly, including inside ``async with``."""
+    async with AsyncMtgJsonTools(cache_dir=tmp_path / "cache", offline=True) as sdk:
+        await sdk.close()
+    await sdk.close()
+    assert sdk.inner._conn._closed
+
+
 # === on_progress callback test ===
 
 
@@ -222,24 +373,66 @@ def test_on_progress_callback(tmp_path):
     sdk.close()
 
 
+def test_on_progress_coalesces_chunks(tmp_path, monkeypatch):
+    """Downloads report progress once per interval plus a final call."""
+    monkeypatch.setattr("mtg_json_tools.cache._PROGRESS_INTERVAL", 3600)
+    payload = b"x" * (65536 * 4)
+
+    def handler(request):
+        return httpx.Response(
+            200, content=payload, headers={"content-length": str(len(payload))}
+        )
+
+    calls = []
+    cache = CacheManager(
+        tmp_path / "cache", on_progress=lambda f, d, t: calls.append((f, d, t))
+    )
+    cache._client = httpx.Client(transport=httpx.MockTransport(handler))
+    dest = tmp_path / "cache" / "Meta.json"
+    cache._download_file("Meta.json", dest)
+    cache.close()
+    assert dest.read_bytes() == payload
+    assert calls == [("Meta.json", len(payload), len(payload))]
+
+
 # === execute_models (TypeAdapter fast path) test ===
 
 
 def test_execute_models_returns_pydantic_instances(sdk_offline):
     """execute_models returns proper Pydantic model instances."""
-    from pydantic import TypeAdapter
-
-    from mtg_json_tools.models.cards import CardSet
-
-    adapter = TypeAdapter(list[CardSet])
     cards = sdk_offline._conn.execute_models(
-        "SELECT * FROM cards ORDER BY name", adapter=adapter
+        "SELECT * FROM cards ORDER BY name", adapter=_CARD_SET_LIST
     )
     assert len(cards) == 3
     assert all(isinstance(c, CardSet) for c in cards)
     assert cards[0].name == "Counterspell"
 
 
+def test_execute_models_by_model_class(sdk_offline):
+    """execute_models(model=...) builds and reuses the list adapter."""
+    sql = "SELECT * FROM cards ORDER BY name"
+    cards = sdk_offline._conn.execute_models(sql, model=CardSet)
+    assert [c.name for c in cards] == [
+        c.name for c in sdk_offline._conn.execute_models(sql, adapter=_CARD_SET_LIST)
+    ]
+    with pytest.raises(TypeError):
+        sdk_offline._conn.execute_models(sql)
+
+
+def test_execute_models_accepts_prepared_statement(sdk_offline):
+    """execute_models validates rows from a prepared statement."""
+    conn = sdk_offline._conn
+    stmt = conn.prepare("SELECT * FROM cards WHERE setCode = $1 ORDER BY name")
+    cards = conn.execute_models(stmt, ["A25"], model=CardSet)
+    assert all(isinstance(c, CardSet) for c in cards)
+    assert [c.name for c in cards] == [
+        r["name"]
+        for r in conn.execute(
+            "SELECT name FROM cards WHERE setCode = 'A25' ORDER BY name"
+        )
+    ]
+
+
 # === No-data / empty state tests ===
 
 
@@ -270,15 +463,8 @@ def test_export_db_no_views(tmp_path):
         assert result == out
         assert out.exists()
 
-        conn = duckdb.connect(str(out))
-        try:
-            tables = conn.execute(
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main'"
-            ).fetchall()
-            assert len(tables) == 0
-        finally:
-            conn.close()
+        with _attached(sdk, out) as duck:
+            assert _exported_tables(duck) == set()
 
 
 def test_refresh_stale_with_no_version(tmp_path):
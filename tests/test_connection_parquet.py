@@ -40,7 +40,8 @@ def parquet_conn(tmp_path):
 
     def write_parquet(view_name: str, table: pa.Table) -> Path:
         p = tmp_path / f"{view_name}.parquet"
-        pq.write_table(table, p)
+        # Write one contiguous row group so each view scans a single batch
+        pq.write_table(table.combine_chunks(), p, row_group_size=len(table) or None)
         paths[view_name] = p
         return p
 
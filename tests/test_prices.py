@@ -1,23 +1,29 @@
 """Tests for the price query module."""
 
+import gzip
 import io
 import json
+from operator import itemgetter
 
+import pyarrow as pa
 import pytest
 
-from mtg_json_tools.queries.prices import PriceQuery, _stream_flatten_prices
+from mtg_json_tools.queries.prices import (
+    PriceQuery,
+    _flatten_prices_arrow,
+    _iter_flatten_prices,
+    _load_prices_to_duckdb,
+    _price_schema,
+    _register_latest_prices,
+    _stream_flatten_prices,
+)
 
 # === _stream_flatten_prices unit tests ===
 
 
 def _flatten_to_list(data: dict) -> list[dict]:
-    """Helper: stream-flatten to an in-memory buffer, parse back to list."""
-    buf = io.StringIO()
-    count = _stream_flatten_prices(data, buf)
-    buf.seek(0)
-    rows = [json.loads(line) for line in buf if line.strip()]
-    assert len(rows) == count
-    return rows
+    """Helper: flatten straight to a list of row dicts."""
+    return list(_iter_flatten_prices(data))
 
 
 def test_flatten_prices():
@@ -73,6 +79,51 @@ def test_flatten_prices_mixed_sources():
     assert sources == {"paper", "mtgo"}
 
 
+def test_stream_flatten_matches_iter_flatten():
+    data = {
+        "uuid-1": {
+            "paper": {
+                "tcgplayer": {
+                    "currency": "USD",
+                    "buylist": {"normal": {"2024-01-01": 0.5}},
+                    "retail": {"normal": {"2024-01-01": 1.0, "2024-01-02": None}},
+                }
+            }
+        }
+    }
+    buf = io.BytesIO()
+    count = _stream_flatten_prices(data, buf)
+    rows = [json.loads(line) for line in buf.getvalue().splitlines()]
+    assert count == 2
+    assert rows == _flatten_to_list(data)
+
+
+def test_flatten_prices_arrow_matches_dicts():
+    data = {
+        "uuid-1": {
+            "paper": {
+                "tcgplayer": {
+                    "currency": "USD",
+                    "buylist": {"normal": {"2024-01-01": 0.5}},
+                    "retail": {
+                        "normal": {"2024-01-01": 1, "2024-01-02": None},
+                        "foil": {"2024-01-01": 3.5, "2024-01-02": 3.75},
+                    },
+                }
+            }
+        },
+        "uuid-2": {"mtgo": {"cardhoarder": {"retail": {"normal": {}}}}},
+    }
+    table = _flatten_prices_arrow(data)
+    assert table.schema.field("date").type == "date32[day]"
+    rows = [
+        dict(r, date=r["date"].isoformat(), price=float(r["price"]))
+        for r in table.to_pylist()
+    ]
+    assert rows == _flatten_to_list(data)
+    assert _flatten_prices_arrow({}).num_rows == 0
+
+
 # === PriceQuery integration tests ===
 
 SAMPLE_PRICE_DATA = [
@@ -148,11 +199,15 @@ SAMPLE_PRICE_DATA = [
     },
 ]
 
+# Built once with the loader's schema so fixtures skip JSON type inference
+_PRICE_ARROW = pa.Table.from_pylist(SAMPLE_PRICE_DATA).cast(_price_schema())
+
 
 @pytest.fixture
 def price_query(sample_db):
     """PriceQuery with sample price data loaded."""
-    sample_db.register_table_from_data("prices_today", SAMPLE_PRICE_DATA)
+    sample_db.register_table_from_arrow("prices_today", _PRICE_ARROW)
+    _register_latest_prices(sample_db)
     pq = PriceQuery.__new__(PriceQuery)
     pq._conn = sample_db
     pq._cache = None
@@ -167,6 +222,39 @@ def test_today_returns_latest_date(price_query):
     assert dates == {"2024-01-03"}
 
 
+def test_today_without_latest_table(price_query):
+    """today() falls back to prices_today when the latest table is missing."""
+    expected = price_query.today("card-uuid-001", provider="tcgplayer")
+    price_query._conn.register_table_from_arrow("prices_today", _PRICE_ARROW)
+    assert "prices_today_latest" not in price_query._conn._derived_tables
+    rows = price_query.today("card-uuid-001", provider="tcgplayer")
+    key = itemgetter("finish", "category")
+    assert sorted(rows, key=key) == sorted(expected, key=key)
+    assert rows
+
+
+def test_today_sees_replaced_prices(price_query):
+    """Replacing prices_today drops the latest-prices table built from it."""
+    row = {
+        "uuid": "card-uuid-001",
+        "source": "paper",
+        "provider": "tcgplayer",
+        "currency": "USD",
+        "category": "retail",
+        "finish": "normal",
+        "date": "2024-02-01",
+        "price": 9.5,
+    }
+    price_query._conn.register_table_from_data("prices_today", [row])
+    assert price_query.today("card-uuid-001") == [row]
+
+
+def test_latest_prices_not_registered(price_query):
+    """prices_today_latest is a helper table, not a registered view."""
+    assert "prices_today_latest" in price_query._conn._derived_tables
+    assert "prices_today_latest" not in price_query._conn._registered_views
+
+
 def test_today_with_provider_filter(price_query):
     rows = price_query.today("card-uuid-001", provider="tcgplayer")
     assert all(r["provider"] == "tcgplayer" for r in rows)
@@ -265,6 +353,14 @@ def test_most_expensive_printings(price_query):
     assert rows[0]["max_price"] >= rows[-1]["max_price"]  # ordered DESC
 
 
+def test_printings_pagination(price_query):
+    """limit/offset are bound parameters and validated."""
+    everything = price_query.most_expensive_printings()
+    assert price_query.most_expensive_printings(limit=1, offset=1) == everything[1:2]
+    with pytest.raises(TypeError):
+        price_query.cheapest_printings(limit="1; DROP TABLE cards")
+
+
 def test_cheapest_printings_no_prices(sample_db):
     """Returns empty list when no price data exists."""
     pq = PriceQuery.__new__(PriceQuery)
@@ -299,11 +395,11 @@ def test_stream_flatten_writes_valid_ndjson_to_file(tmp_path):
         },
     }
     out_path = tmp_path / "prices.ndjson"
-    with open(out_path, "w", encoding="utf-8") as f:
+    with open(out_path, "wb") as f:
         count = _stream_flatten_prices(data, f)
 
     # Re-read and parse each line independently
-    lines = out_path.read_text(encoding="utf-8").strip().split("\n")
+    lines = out_path.read_bytes().splitlines()
     assert len(lines) == count
     for line in lines:
         row = json.loads(line)
@@ -327,14 +423,144 @@ def test_stream_flatten_count_matches_output():
             }
         }
     }
-    buf = io.StringIO()
+    buf = io.BytesIO()
     count = _stream_flatten_prices(data, buf)
-    buf.seek(0)
-    actual_lines = [line for line in buf if line.strip()]
+    actual_lines = [line for line in buf.getvalue().splitlines() if line.strip()]
     assert count == 3
     assert len(actual_lines) == count
 
 
+def test_stream_flatten_binary_sink():
+    """Binary sinks receive bytes lines (the loader's NDJSON temp file)."""
+    data = {"u1": {"paper": {"tcgplayer": {"retail": {"foil": {"2024-01-01": 2}}}}}}
+    buf = io.BytesIO()
+    count = _stream_flatten_prices(data, buf)
+    lines = buf.getvalue().splitlines()
+    assert count == len(lines) == 1
+    assert json.loads(lines[0])["price"] == 2.0
+
+
+# === Loader tests ===
+
+
+def test_load_prices_from_gzip(sample_db, tmp_path):
+    """_load_prices_to_duckdb flattens a gzipped AllPricesToday file."""
+    path = tmp_path / "AllPricesToday.json.gz"
+    data = {
+        "meta": {"date": "2024-01-02"},
+        "data": {
+            "card-uuid-001": {
+                "paper": {
+                    "tcgplayer": {
+                        "currency": "USD",
+                        "retail": {
+                            "normal": {
+                                "2024-01-01": 1.5,
+                                "2024-01-02": 2,
+                                "2024-01-03": None,
+                            }
+                        },
+                    }
+                }
+            }
+        },
+    }
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(data, f)
+    _load_prices_to_duckdb(path, sample_db)
+    assert "prices_today_latest" in sample_db._derived_tables
+    rows = sample_db.execute("SELECT date, price FROM prices_today ORDER BY date")
+    assert rows == [
+        {"date": "2024-01-01", "price": 1.5},
+        {"date": "2024-01-02", "price": 2.0},
+    ]
+
+
+def test_load_streaming_from_memory(sample_db):
+    """load_streaming loads parsed price data without a cached file."""
+    pq = PriceQuery(sample_db, None)
+    pq.load_streaming(
+        {
+            "card-uuid-001": {
+                "paper": {
+                    "tcgplayer": {
+                        "currency": "USD",
+                        "retail": {"foil": {"2024-01-01": 3, "2024-01-02": 4.5}},
+                    }
+                }
+            }
+        }
+    )
+    rows = pq.today("card-uuid-001")
+    assert [(r["finish"], r["date"], r["price"]) for r in rows] == [
+        ("foil", "2024-01-02", 4.5)
+    ]
+
+
+@pytest.mark.parametrize("use_arrow", [True, False])
+def test_load_streaming_empty_drops_prices(sample_db, monkeypatch, use_arrow):
+    """load_streaming({}) replaces earlier prices with no prices."""
+    if not use_arrow:
+        monkeypatch.setattr("mtg_json_tools.queries.prices.pa", None)
+    pq = PriceQuery(sample_db, None)
+    pq.load_streaming(
+        {
+            "card-uuid-001": {
+                "paper": {
+                    "tcgplayer": {
+                        "currency": "USD",
+                        "retail": {"normal": {"2024-01-01": 1.5}},
+                    }
+                }
+            }
+        }
+    )
+    assert pq.today("card-uuid-001")
+    pq.load_streaming({})
+    assert pq.today("card-uuid-001") == []
+    assert "prices_today" not in sample_db._registered_views
+    assert not sample_db._derived_tables
+    assert sample_db.execute(
+        "SELECT COUNT(*) AS n FROM information_schema.tables "
+        "WHERE table_name LIKE 'prices_today%'"
+    ) == [{"n": 0}]
+
+
+def test_load_streaming_string_prices_agree(sample_db, monkeypatch):
+    """Numeric-string prices load the same via Arrow and via NDJSON."""
+    data = {
+        "card-uuid-001": {
+            "paper": {
+                "tcgplayer": {
+                    "currency": "USD",
+                    "retail": {"normal": {"2024-01-01": "1.5", "2024-01-02": 2}},
+                }
+            }
+        }
+    }
+    pq = PriceQuery(sample_db, None)
+    sql = "SELECT date, price FROM prices_today ORDER BY date"
+    pq.load_streaming(data)
+    arrow_rows = sample_db.execute(sql)
+    monkeypatch.setattr("mtg_json_tools.queries.prices.pa", None)
+    pq.load_streaming(data)
+    assert (
+        sample_db.execute(sql)
+        == arrow_rows
+        == [
+            {"date": "2024-01-01", "price": 1.5},
+            {"date": "2024-01-02", "price": 2.0},
+        ]
+    )
+
+
+def test_load_prices_empty_not_registered(sample_db, tmp_path):
+    path = tmp_path / "AllPricesToday.json"
+    path.write_text(json.dumps({"data": {}}), encoding="utf-8")
+    _load_prices_to_duckdb(path, sample_db)
+    assert "prices_today" not in sample_db._registered_views
+
+
 # === No-data state tests ===
 
 
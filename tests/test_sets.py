@@ -1,8 +1,10 @@
 """Tests for set queries."""
 
+import pyarrow as pa
 import pytest
 
 from mtg_json_tools.models.sets import SetList
+from mtg_json_tools.queries.prices import _price_schema
 
 # Price data matching SAMPLE_CARDS (card-uuid-001 in A25, card-uuid-002 in MH2)
 _SET_PRICE_DATA = [
@@ -37,12 +39,13 @@ _SET_PRICE_DATA = [
         "price": 3.00,
     },
 ]
+_SET_PRICE_ARROW = pa.Table.from_pylist(_SET_PRICE_DATA).cast(_price_schema())
 
 
 @pytest.fixture
 def sdk_with_prices(sdk_offline):
     """SDK fixture with price data loaded alongside cards/sets."""
-    sdk_offline._conn.register_table_from_data("prices_today", _SET_PRICE_DATA)
+    sdk_offline._conn.register_table_from_arrow("prices_today", _SET_PRICE_ARROW)
     return sdk_offline
 
 
@@ -0,0 +1,153 @@
+"""Tests for the TCGPlayer SKU query module."""
+
+import gzip
+import json
+
+import pytest
+
+from mtg_json_tools.connection import Connection
+from mtg_json_tools.queries.skus import (
+    SkuQuery,
+    _json_object_size_limit,
+    _load_skus_to_duckdb,
+)
+
+SAMPLE_SKU_FILE = {
+    "meta": {"date": "2024-01-01", "version": "5.2.2"},
+    "data": {
+        "card-uuid-001": [
+            {
+                "condition": "NEAR MINT",
+                "language": "ENGLISH",
+                "printing": "NON FOIL",
+                "productId": 1001,
+                "skuId": 5001,
+            },
+            {
+                "condition": "NEAR MINT",
+                "language": "ENGLISH",
+                "printing": "FOIL",
+                "productId": 1001,
+                "skuId": 5002,
+            },
+        ],
+        "card-uuid-002": [
+            {
+                "condition": "LIGHTLY PLAYED",
+                "finish": "FOIL ETCHED",
+                "language": "ENGLISH",
+                "printing": "FOIL",
+                "productId": 1002,
+                "skuId": 5003,
+            },
+        ],
+    },
+}
+
+
+@pytest.fixture
+def sku_query(sample_db, tmp_path):
+    """SkuQuery with sample SKU data loaded from a gzipped JSON file."""
+    path = tmp_path / "TcgplayerSkus.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(SAMPLE_SKU_FILE, f)
+    _load_skus_to_duckdb(path, sample_db)
+    return SkuQuery(sample_db, sample_db.cache)
+
+
+def test_load_skus_flattens_rows(sku_query):
+    rows = sku_query._conn.execute("SELECT * FROM tcgplayer_skus ORDER BY skuId")
+    assert len(rows) == 3
+    assert rows[0]["uuid"] == "card-uuid-001"
+    assert rows[2]["finish"] == "FOIL ETCHED"
+    assert "tcgplayer_skus" in sku_query._conn._registered_views
+
+
+def test_load_skus_uncompressed(sample_db, tmp_path):
+    path = tmp_path / "TcgplayerSkus.json"
+    path.write_text(json.dumps(SAMPLE_SKU_FILE), encoding="utf-8")
+    _load_skus_to_duckdb(path, sample_db)
+    assert sample_db.execute_scalar("SELECT COUNT(*) FROM tcgplayer_skus") == 3
+
+
+def test_load_skus_empty_not_registered(sample_db, tmp_path):
+    path = tmp_path / "TcgplayerSkus.json"
+    path.write_text(json.dumps({"data": {}}), encoding="utf-8")
+    _load_skus_to_duckdb(path, sample_db)
+    assert "tcgplayer_skus" not in sample_db._registered_views
+
+
+def test_load_skus_skips_malformed_entries(sample_db, tmp_path):
+    """Non-list entries and non-object items are skipped, not fatal."""
+    data = {
+        "card-uuid-001": SAMPLE_SKU_FILE["data"]["card-uuid-001"],
+        "card-uuid-002": {"skuId": 5003},
+        "card-uuid-003": 7,
+        "card-uuid-004": ["not a sku"],
+    }
+    path = tmp_path / "TcgplayerSkus.json"
+    path.write_text(json.dumps({"data": data}), encoding="utf-8")
+    _load_skus_to_duckdb(path, sample_db)
+    rows = sample_db.execute("SELECT uuid, skuId FROM tcgplayer_skus ORDER BY skuId")
+    assert rows == [
+        {"uuid": "card-uuid-001", "skuId": 5001},
+        {"uuid": "card-uuid-001", "skuId": 5002},
+    ]
+
+
+def test_load_skus_keeps_unknown_keys(sample_db, tmp_path):
+    """Keys outside the known SKU fields still become columns."""
+    sku = {**SAMPLE_SKU_FILE["data"]["card-uuid-002"][0], "variant": "SHOWCASE"}
+    path = tmp_path / "TcgplayerSkus.json"
+    path.write_text(json.dumps({"data": {"card-uuid-002": [sku]}}), encoding="utf-8")
+    _load_skus_to_duckdb(path, sample_db)
+    assert sample_db.execute("SELECT * FROM tcgplayer_skus") == [
+        {**sku, "uuid": "card-uuid-002"}
+    ]
+
+
+def test_sku_get(sku_query):
+    skus = sku_query.get("card-uuid-001")
+    assert len(skus) == 2
+    assert {s["skuId"] for s in skus} == {5001, 5002}
+
+
+def test_sku_find_by_sku_id(sku_query):
+    sku = sku_query.find_by_sku_id(5003)
+    assert sku is not None
+    assert sku["uuid"] == "card-uuid-002"
+
+
+def test_sku_find_by_product_id(sku_query):
+    assert len(sku_query.find_by_product_id(1001)) == 2
+
+
+def test_load_skus_persists_and_reuses_database(sample_db, tmp_path):
+    path = tmp_path / "TcgplayerSkus.json"
+    path.write_text(json.dumps(SAMPLE_SKU_FILE), encoding="utf-8")
+    _load_skus_to_duckdb(path, sample_db)
+    cached = list(sample_db.cache.cache_dir.glob("skus_*.duckdb"))
+    assert len(cached) == 1
+
+    # A second connection attaches the persisted file instead of re-ingesting
+    conn = Connection(sample_db.cache)
+    try:
+        _load_skus_to_duckdb(path, conn)
+        assert conn.execute_scalar("SELECT COUNT(*) FROM tcgplayer_skus") == 3
+        assert list(sample_db.cache.cache_dir.glob("skus_*.duckdb")) == cached
+    finally:
+        conn.close()
+
+
+def test_json_object_size_limit_follows_document_size(tmp_path, monkeypatch):
+    """The object size cap is twice the uncompressed document, with a floor."""
+    payload = json.dumps(SAMPLE_SKU_FILE).encode()
+    plain = tmp_path / "TcgplayerSkus.json"
+    plain.write_bytes(payload)
+    packed = tmp_path / "TcgplayerSkus.json.gz"
+    packed.write_bytes(gzip.compress(payload))
+    assert _json_object_size_limit(plain) == 16 * 1024 * 1024
+
+    monkeypatch.setattr("mtg_json_tools.queries.skus._MIN_JSON_OBJECT_SIZE", 0)
+    assert _json_object_size_limit(plain) == 2 * len(payload)
+    assert _json_object_size_limit(packed) == 2 * len(payload)
@@ -1,8 +1,13 @@
 """Tests for the SQL builder."""
 
+import random
+import string
+
 import duckdb
+import pyarrow as pa
 import pytest
 
+from mtg_json_tools import _sql
 from mtg_json_tools._sql import SQLBuilder
 
 
@@ -50,6 +55,19 @@ def test_where_or_combined_with_and():
     assert params == ["A25", "rare", "mythic"]
 
 
+def test_where_in_binds_single_list_param():
+    q = SQLBuilder("cards").where_eq("setCode", "A25").where_in("uuid", ["a", "b"])
+    sql, params = q.build()
+    assert "uuid = ANY($2)" in sql
+    assert params == ["A25", ["a", "b"]]
+
+
+def test_where_in_empty():
+    sql, params = SQLBuilder("cards").where_in("uuid", []).build()
+    assert "WHERE FALSE" in sql
+    assert params == []
+
+
 def test_group_by():
     q = SQLBuilder("cards").select("setCode", "COUNT(*)").group_by("setCode")
     sql, params = q.build()
@@ -115,6 +133,19 @@ def test_where_fuzzy_with_other_conditions():
     assert params == ["A25", "Ligtning Bolt"]
 
 
+def test_where_fuzzy_in_without_rapidfuzz(monkeypatch):
+    monkeypatch.setattr(_sql, "rf_process", None)
+    q = (
+        SQLBuilder("cards")
+        .where_eq("setCode", "A25")
+        .where_fuzzy_in("name", "Ligtning Bolt", ["Lightning Bolt", "Counterspell"])
+    )
+    sql, params = q.build()
+    assert "name = ANY($2)" in sql
+    assert "jaro_winkler_similarity(name, $3) > 0.8" in sql
+    assert params == ["A25", ["Lightning Bolt", "Counterspell"], "Ligtning Bolt"]
+
+
 def test_full_query():
     q = (
         SQLBuilder("prices_today")
@@ -155,6 +186,20 @@ def test_limit_accepts_zero():
     assert "LIMIT 0" in sql
 
 
+def test_limit_accepts_index_types():
+    class Count:
+        def __index__(self):
+            return 7
+
+    sql, _ = SQLBuilder("t").limit(Count()).offset(True).build()
+    assert sql.endswith("LIMIT 7\nOFFSET 1")
+
+
+def test_limit_rejects_float():
+    with pytest.raises(TypeError, match="non-negative integer"):
+        SQLBuilder("t").limit(2.0)
+
+
 def test_offset_rejects_string():
     with pytest.raises(TypeError, match="non-negative integer"):
         SQLBuilder("t").offset("0")
@@ -168,25 +213,34 @@ def test_offset_rejects_negative():
 def test_fuzzy_threshold_rejects_out_of_range():
     with pytest.raises(ValueError, match="between 0 and 1"):
         SQLBuilder("t").where_fuzzy("name", "Bolt", threshold=2.0)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        SQLBuilder("t").where_fuzzy_in("name", "Bolt", ["Bolt"], threshold=-1)
 
 
 # === Execution-validated tests (run SQL against real DuckDB) ===
 
 
-@pytest.fixture
-def duckdb_conn():
-    """In-memory DuckDB with a small test table."""
+@pytest.fixture(scope="module")
+def _items_db():
+    """In-memory DuckDB with a small test table, built once per module."""
     conn = duckdb.connect(":memory:")
     conn.execute("CREATE TABLE items (name VARCHAR, category VARCHAR, price DOUBLE)")
-    conn.execute("INSERT INTO items VALUES ('Alpha', 'A', 1.0)")
-    conn.execute("INSERT INTO items VALUES ('Beta', 'A', 2.0)")
-    conn.execute("INSERT INTO items VALUES ('Gamma', 'B', 3.0)")
-    conn.execute("INSERT INTO items VALUES ('Delta', 'B', 4.0)")
-    conn.execute("INSERT INTO items VALUES ('Epsilon', 'A', 5.0)")
+    conn.execute(
+        "INSERT INTO items VALUES ('Alpha', 'A', 1.0), ('Beta', 'A', 2.0), "
+        "('Gamma', 'B', 3.0), ('Delta', 'B', 4.0), ('Epsilon', 'A', 5.0)"
+    )
     yield conn
     conn.close()
 
 
+@pytest.fixture
+def duckdb_conn(_items_db):
+    """Per-test cursor on the shared database (same catalog, own transaction)."""
+    cursor = _items_db.cursor()
+    yield cursor
+    cursor.close()
+
+
 def test_where_eq_executes(duckdb_conn):
     """where_eq produces valid SQL that returns correct rows."""
     sql, params = SQLBuilder("items").where_eq("name", "Gamma").build()
@@ -195,6 +249,15 @@ def test_where_eq_executes(duckdb_conn):
     assert rows[0][0] == "Gamma"
 
 
+def test_where_in_executes(duckdb_conn):
+    """where_in's list parameter matches every listed value."""
+    sql, params = (
+        SQLBuilder("items").where_in("name", ["Alpha", "Delta"]).order_by("name")
+    ).build()
+    rows = duckdb_conn.execute(sql, params).fetchall()
+    assert [r[0] for r in rows] == ["Alpha", "Delta"]
+
+
 def test_group_by_having_executes(duckdb_conn):
     """GROUP BY + HAVING produces valid aggregate SQL."""
     sql, params = (
@@ -234,3 +297,37 @@ def test_distinct_executes(duckdb_conn):
     assert len(rows) == 2
     assert rows[0][0] == "A"
     assert rows[1][0] == "B"
+
+
+def test_where_regex_executes(duckdb_conn):
+    """where_regex's bound pattern is matched by DuckDB's native regex engine."""
+    q = SQLBuilder("items").select("name").where_regex("name", "^[A-D].*a$")
+    sql, params = q.order_by("name").build()
+    assert duckdb_conn.execute(sql, params).fetchall() == [
+        ("Alpha",),
+        ("Beta",),
+        ("Delta",),
+    ]
+
+
+def test_where_fuzzy_in_matches_duckdb_scoring(duckdb_conn):
+    """The client-side shortlist selects exactly what DuckDB would."""
+    rng = random.Random(0)
+    names = ["Lightning Bolt", "Lightning Helix", "Ligtning Blot", "Bolt"]
+    names += [
+        "".join(rng.choices(string.ascii_letters + " ", k=rng.randint(3, 20)))
+        for _ in range(10_000)
+    ]
+    duckdb_conn.register("names", pa.table({"name": names}))
+
+    sql, params = (
+        SQLBuilder("names").where_fuzzy_in("name", "Ligtning Bolt", names).build()
+    )
+    rows = duckdb_conn.execute(sql, params).fetchall()
+    expected = duckdb_conn.execute(
+        "SELECT name FROM names WHERE jaro_winkler_similarity(name, $1) > 0.8",
+        ["Ligtning Bolt"],
+    ).fetchall()
+    assert sorted(rows) == sorted(expected)
+    assert ("Lightning Bolt",) in rows
+    assert len(rows) < 10
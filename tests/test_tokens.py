@@ -20,6 +20,24 @@ def test_token_get_by_uuid_as_dict(sdk_offline):
     assert token["name"] == "Soldier Token"
 
 
+def test_token_get_by_uuid_cached(sdk_offline):
+    sdk_offline.tokens.get_by_uuid("token-uuid-001")
+    sdk_offline.tokens.get_by_uuid("token-uuid-001")
+    assert sdk_offline.tokens._get_token_cached.cache_info().hits == 1
+    sdk_offline.tokens.refresh()
+    assert sdk_offline.tokens._get_token_cached.cache_info().currsize == 0
+
+
+def test_token_get_by_uuid_cached_returns_fresh_models(sdk_offline):
+    first = sdk_offline.tokens.get_by_uuid("token-uuid-001")
+    first.name = "Changed"
+    first.colors.append("B")
+    second = sdk_offline.tokens.get_by_uuid("token-uuid-001")
+    assert second is not first
+    assert second.name == "Soldier Token"
+    assert second.colors == ["W"]
+
+
 def test_token_get_by_name(sdk_offline):
     tokens = sdk_offline.tokens.get_by_name("Soldier Token")
     assert len(tokens) == 1
@@ -37,12 +55,29 @@ def test_token_search_by_set(sdk_offline):
     assert tokens[0].set_code == "A25"
 
 
+def test_token_search_by_name_and_set(sdk_offline):
+    tokens = sdk_offline.tokens.search(name="Beast Token", set_code="MH2")
+    assert [t.name for t in tokens] == ["Beast Token"]
+    assert sdk_offline.tokens.search(name="Beast Token", set_code="A25") == []
+
+
+def test_token_search_no_filters(sdk_offline):
+    tokens = sdk_offline.tokens.search()
+    assert len(tokens) == 2
+    assert [t.name for t in tokens] == sorted(t.name for t in tokens)
+    assert len(sdk_offline.tokens.search(limit=1, offset=1)) == 1
+
+
 def test_token_search_by_colors(sdk_offline):
     tokens = sdk_offline.tokens.search(colors=["G"])
     assert len(tokens) == 1
     assert tokens[0].name == "Beast Token"
 
 
+def test_token_search_by_colors_requires_all(sdk_offline):
+    assert sdk_offline.tokens.search(colors=["G", "W"]) == []
+
+
 def test_token_for_set(sdk_offline):
     tokens = sdk_offline.tokens.for_set("MH2")
     assert len(tokens) == 1
@@ -67,6 +102,27 @@ def test_token_get_by_uuids(sdk_offline):
     assert names == {"Soldier Token", "Beast Token"}
 
 
+def test_token_get_by_uuids_reuses_prepared_statement(sdk_offline, monkeypatch):
+    """Lookups of any size share one statement, parsed on first use."""
+    conn = sdk_offline._conn
+    prepared = []
+    prepare = conn.prepare
+
+    def spy(sql):
+        prepared.append(prepare(sql))
+        return prepared[-1]
+
+    monkeypatch.setattr(conn, "prepare", spy)
+    first = sdk_offline.tokens.get_by_uuids(["token-uuid-001"])
+    second = sdk_offline.tokens.get_by_uuids(
+        ["token-uuid-001", "token-uuid-002", "no-such-uuid"]
+    )
+    assert [t.uuid for t in first] == ["token-uuid-001"]
+    assert {t.uuid for t in second} == {"token-uuid-001", "token-uuid-002"}
+    assert len(prepared) == 2
+    assert prepared[0] is prepared[1]
+
+
 def test_token_get_by_uuids_empty(sdk_offline):
     assert sdk_offline.tokens.get_by_uuids([]) == []
 